@@ -0,0 +1,186 @@
+import collections
+import concurrent.futures
+import functools
+import itertools
+import os
+import time
+import typing as tp
+
+from homework01 import rsa
+from homework01.caesar import decrypt_caesar, encrypt_caesar
+from homework01.vigenere import decrypt_vigenere, encrypt_vigenere
+
+Record = tp.Tuple[str, tp.Any]
+T = tp.TypeVar("T")
+R = tp.TypeVar("R")
+
+CIPHERS: tp.Dict[str, tp.Tuple[tp.Callable[[str, tp.Any], str], tp.Callable[[str, tp.Any], str]]] = {
+    "caesar": (encrypt_caesar, decrypt_caesar),
+    "vigenere": (encrypt_vigenere, decrypt_vigenere),
+}
+
+
+class BatchStats:
+    """Counters of a batch run, filled in while the results are consumed"""
+
+    def __init__(self) -> None:
+        self.records = 0
+        self.chunks = 0
+        self.seconds = 0.0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+
+    @property
+    def records_per_second(self) -> float:
+        return self.records / self.seconds if self.seconds else 0.0
+
+    @property
+    def latency_mean(self) -> float:
+        """Mean time from submitting a chunk to getting its results"""
+        return self.latency_total / self.chunks if self.chunks else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"BatchStats(records={self.records}, chunks={self.chunks}, "
+            f"seconds={self.seconds:.3f}, records_per_second={self.records_per_second:.0f}, "
+            f"latency_mean={self.latency_mean:.4f}, latency_max={self.latency_max:.4f})"
+        )
+
+
+def _pipeline(
+    items: tp.Iterable[T],
+    process: tp.Callable[[tp.List[T]], tp.List[R]],
+    chunk_size: int,
+    max_workers: tp.Optional[int],
+    max_pending: tp.Optional[int],
+    stats: tp.Optional[BatchStats],
+    initializer: tp.Optional[tp.Callable[..., None]] = None,
+    initargs: tp.Tuple[tp.Any, ...] = (),
+) -> tp.Iterator[R]:
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_pending is None:
+        max_pending = 2 * max_workers
+    return _iter_pipeline(
+        iter(items), process, chunk_size, max_workers, max_pending, stats or BatchStats(), initializer, initargs
+    )
+
+
+def _iter_pipeline(
+    items: tp.Iterator[T],
+    process: tp.Callable[[tp.List[T]], tp.List[R]],
+    chunk_size: int,
+    max_workers: int,
+    max_pending: int,
+    stats: BatchStats,
+    initializer: tp.Optional[tp.Callable[..., None]],
+    initargs: tp.Tuple[tp.Any, ...],
+) -> tp.Iterator[R]:
+    """
+    Sends chunks of items to a process pool and yields the results in input order.
+    At most max_pending chunks are in flight, so an endless input is never materialized.
+    """
+    start = time.perf_counter()
+    with concurrent.futures.ProcessPoolExecutor(max_workers, initializer=initializer, initargs=initargs) as executor:
+        pending: tp.Deque[tp.Tuple[float, concurrent.futures.Future]] = collections.deque()
+        while True:
+            chunk = list(itertools.islice(items, chunk_size))
+            if chunk:
+                pending.append((time.perf_counter(), executor.submit(process, chunk)))
+            if pending and (not chunk or len(pending) >= max_pending):
+                submitted, future = pending.popleft()
+                results = future.result()
+                now = time.perf_counter()
+                stats.records += len(results)
+                stats.chunks += 1
+                stats.seconds = now - start
+                stats.latency_total += now - submitted
+                stats.latency_max = max(stats.latency_max, now - submitted)
+                yield from results
+            if not chunk and not pending:
+                break
+
+
+def _process_chunk(cipher: str, decrypt: bool, chunk: tp.List[Record]) -> tp.List[str]:
+    func = CIPHERS[cipher][decrypt]
+    return [func(text, key) for text, key in chunk]
+
+
+def _run_batch(
+    records: tp.Iterable[Record],
+    cipher: str,
+    decrypt: bool,
+    chunk_size: int,
+    max_workers: tp.Optional[int],
+    max_pending: tp.Optional[int],
+    stats: tp.Optional[BatchStats],
+) -> tp.Iterator[str]:
+    if cipher not in CIPHERS:
+        raise ValueError(f"Unknown cipher {cipher!r}, expected one of {sorted(CIPHERS)}")
+    process = functools.partial(_process_chunk, cipher, decrypt)
+    return _pipeline(records, process, chunk_size, max_workers, max_pending, stats)
+
+
+def encrypt_batch(
+    records: tp.Iterable[Record],
+    cipher: str = "caesar",
+    chunk_size: int = 1000,
+    max_workers: tp.Optional[int] = None,
+    max_pending: tp.Optional[int] = None,
+    stats: tp.Optional[BatchStats] = None,
+) -> tp.Iterator[str]:
+    """
+    Encrypts (text, key) records on a pool of processes, yielding ciphertexts in input order.
+    Records are sent to workers by chunks of chunk_size and at most max_pending chunks
+    are in flight, so an endless generator of records is never materialized.
+    """
+    return _run_batch(records, cipher, False, chunk_size, max_workers, max_pending, stats)
+
+
+def decrypt_batch(
+    records: tp.Iterable[Record],
+    cipher: str = "caesar",
+    chunk_size: int = 1000,
+    max_workers: tp.Optional[int] = None,
+    max_pending: tp.Optional[int] = None,
+    stats: tp.Optional[BatchStats] = None,
+) -> tp.Iterator[str]:
+    """Decrypts (text, key) records on a pool of processes, yielding plaintexts in input order"""
+    return _run_batch(records, cipher, True, chunk_size, max_workers, max_pending, stats)
+
+
+# The RSA key and the public exponent of a worker process,
+# sent once by the pool initializer instead of with every task
+_worker_key: tp.Optional[rsa.Key] = None
+_worker_exponent: tp.Optional[int] = None
+
+
+def _init_rsa_worker(pk: rsa.Key, e: tp.Optional[int] = None) -> None:
+    global _worker_key, _worker_exponent  # pylint: disable=global-statement
+    _worker_key = pk
+    _worker_exponent = e
+
+
+def _decrypt_rsa_chunk(chunk: tp.List[bytes]) -> tp.List[bytes]:
+    assert _worker_key is not None
+    return [rsa.decrypt_blocks(_worker_key, ciphertext, _worker_exponent) for ciphertext in chunk]
+
+
+def decrypt_rsa_batch(
+    pk: rsa.Key,
+    ciphertexts: tp.Iterable[bytes],
+    chunk_size: int = 100,
+    max_workers: tp.Optional[int] = None,
+    max_pending: tp.Optional[int] = None,
+    stats: tp.Optional[BatchStats] = None,
+    e: tp.Optional[int] = None,
+) -> tp.Iterator[bytes]:
+    """
+    Decrypts rsa.encrypt_blocks ciphertexts on a pool of processes, yielding plaintexts in input order.
+    Every worker receives the key once when it starts, so pass a CRTKey to have
+    the CRT parameters computed once and reused for every block.
+    The public exponent e turns on blinding in rsa.decrypt_blocks.
+    """
+    return _pipeline(
+        ciphertexts, _decrypt_rsa_chunk, chunk_size, max_workers, max_pending, stats, _init_rsa_worker, (pk, e)
+    )
@@ -0,0 +1,272 @@
+"""
+Throughput benchmarks of the homework01 ciphers.
+
+    python -m homework01.benchmark --output results.json
+    python -m homework01.benchmark --baseline results.json --threshold 0.2
+"""
+
+import argparse
+import json
+import pathlib
+import random
+import string
+import sys
+import time
+import typing as tp
+
+from homework01 import caesar, envelope, rsa, vigenere
+
+KB = 1024
+MB = 1024 * KB
+SIZES = (KB, 64 * KB, MB, 16 * MB, 100 * MB)
+KEY_LENGTHS = (1, 8, 64)
+RSA_KEY_BITS = (64, 512)
+RSA_SIZES = (256, KB)
+PRIME_BITS = (512, 1024)
+INVERSE_COUNTS = (1000,)
+INVERSE_BITS = 1024
+
+Result = tp.Dict[str, tp.Any]
+
+
+def make_text(size: int, seed: int = 0) -> str:
+    """Random letters, spaces and punctuation of the given size"""
+    rnd = random.Random(seed)
+    block = "".join(rnd.choices(string.ascii_letters + " .,\n", k=min(size, KB)))
+    return (block * (size // len(block) + 1))[:size] if block else ""
+
+
+def make_keyword(length: int, seed: int = 0) -> str:
+    rnd = random.Random(seed)
+    return "".join(rnd.choices(string.ascii_uppercase, k=length))
+
+
+def make_primes(bits: int) -> tp.Tuple[int, int]:
+    """Two distinct primes of bits // 2 bits each"""
+    primes: tp.List[int] = []
+    candidate = 2 ** (bits // 2 - 1) + 1
+    while len(primes) < 2:
+        if rsa.is_prime(candidate):
+            primes.append(candidate)
+        candidate += 2
+    return primes[0], primes[1]
+
+
+def timeit(func: tp.Callable[[], tp.Any], repeat: int = 3) -> float:
+    """Best wall time of repeat runs of func"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _result(name: str, params: tp.Dict[str, tp.Any], size: int, seconds: float, unit: str = "bytes") -> Result:
+    """
+    size is counted in unit, "bytes" for the ciphers and "ops" for the number theory functions.
+    The throughput goes to the field named after the unit, bytes_per_second or ops_per_second.
+    """
+    return {
+        "name": name,
+        "params": params,
+        "size": size,
+        "unit": unit,
+        "seconds": seconds,
+        f"{unit}_per_second": size / seconds if seconds else float("inf"),
+    }
+
+
+def _metric(result: Result) -> str:
+    """
+    The throughput field of a result, results written before the unit field was added are in bytes
+    >>> _metric({"unit": "ops"}), _metric({})
+    ('ops_per_second', 'bytes_per_second')
+    """
+    return f"{result.get('unit', 'bytes')}_per_second"
+
+
+def bench_caesar(sizes: tp.Iterable[int], repeat: int) -> tp.Iterator[Result]:
+    for size in sizes:
+        text = make_text(size)
+        ciphertext = caesar.encrypt_caesar(text, 7)
+        yield _result("caesar.encrypt", {}, size, timeit(lambda: caesar.encrypt_caesar(text, 7), repeat))
+        yield _result("caesar.decrypt", {}, size, timeit(lambda: caesar.decrypt_caesar(ciphertext, 7), repeat))
+
+
+def bench_vigenere(sizes: tp.Iterable[int], key_lengths: tp.Iterable[int], repeat: int) -> tp.Iterator[Result]:
+    for size in sizes:
+        text = make_text(size)
+        for key_length in key_lengths:
+            keyword = make_keyword(key_length)
+            ciphertext = vigenere.encrypt_vigenere(text, keyword)
+            params = {"key_length": key_length}
+            seconds = timeit(lambda: vigenere.encrypt_vigenere(text, keyword), repeat)
+            yield _result("vigenere.encrypt", params, size, seconds)
+            seconds = timeit(lambda: vigenere.decrypt_vigenere(ciphertext, keyword), repeat)
+            yield _result("vigenere.decrypt", params, size, seconds)
+
+
+def bench_rsa(sizes: tp.Iterable[int], key_bits: tp.Iterable[int], repeat: int) -> tp.Iterator[Result]:
+    for bits in key_bits:
+        p, q = make_primes(bits)
+        public, private = rsa.generate_keypair(p, q)
+        private_crt = rsa.crt_key(private, p, q)
+        for size in sizes:
+            text = make_text(size)
+            ciphertext = rsa.encrypt(public, text)
+            params = {"key_bits": bits}
+            yield _result("rsa.encrypt", params, size, timeit(lambda: rsa.encrypt(public, text), repeat))
+            yield _result("rsa.decrypt", params, size, timeit(lambda: rsa.decrypt(private, ciphertext), repeat))
+            seconds = timeit(lambda: rsa.decrypt(private_crt, ciphertext), repeat)
+            yield _result("rsa.decrypt_crt", params, size, seconds)
+            if rsa.block_capacity(public) < 1:
+                continue
+            data = text.encode("ascii")
+            packed = rsa.encrypt_blocks(public, data)
+            seconds = timeit(lambda: rsa.encrypt_blocks(public, data), repeat)
+            yield _result("rsa.encrypt_blocks", params, size, seconds)
+            seconds = timeit(lambda: rsa.decrypt_blocks(private_crt, packed), repeat)
+            yield _result("rsa.decrypt_blocks", params, size, seconds)
+
+
+def bench_envelope(sizes: tp.Iterable[int], key_bits: tp.Iterable[int], repeat: int) -> tp.Iterator[Result]:
+    """Hybrid encryption over the same key sizes as bench_rsa and the large input sizes"""
+    for bits in key_bits:
+        p, q = make_primes(bits)
+        public, private = rsa.generate_keypair(p, q)
+        if rsa.block_capacity(public) < 1:
+            continue
+        private_crt = rsa.crt_key(private, p, q)
+        for size in sizes:
+            data = make_text(size).encode("ascii")
+            sealed = envelope.seal(public, data)
+            params = {"key_bits": bits}
+            yield _result("envelope.seal", params, size, timeit(lambda: envelope.seal(public, data), repeat))
+            seconds = timeit(lambda: envelope.unseal(private_crt, sealed), repeat)
+            yield _result("envelope.unseal", params, size, seconds)
+
+
+def bench_primes(prime_bits: tp.Iterable[int], repeat: int) -> tp.Iterator[Result]:
+    for bits in prime_bits:
+        yield _result("rsa.generate_prime", {"bits": bits}, 1, timeit(lambda: rsa.generate_prime(bits), repeat), "ops")
+
+
+def bench_inverse(counts: tp.Iterable[int], bits: int, repeat: int) -> tp.Iterator[Result]:
+    """
+    One modular inversion per value, by Euclid or by the binary extended gcd,
+    against Montgomery's batch trick, and Euclid's gcd against the binary one
+    """
+    rnd = random.Random(0)
+    n = rnd.getrandbits(bits) | 1
+    params = {"bits": bits}
+    for count in counts:
+        values = [v for v in (rnd.randrange(2, n) for _ in range(count)) if rsa.gcd(v, n) == 1]
+        pairs = [(rnd.getrandbits(bits), rnd.getrandbits(bits)) for _ in range(count)]
+        seconds = timeit(lambda: [rsa.multiplicative_inverse(v, n) for v in values], repeat)
+        yield _result("rsa.multiplicative_inverse", params, count, seconds, "ops")
+        seconds = timeit(lambda: [rsa.binary_extended_gcd(v, n) for v in values], repeat)
+        yield _result("rsa.binary_extended_gcd", params, count, seconds, "ops")
+        seconds = timeit(lambda: rsa.batch_inverse(values, n), repeat)
+        yield _result("rsa.batch_inverse", params, count, seconds, "ops")
+        seconds = timeit(lambda: [rsa.gcd(a, b) for a, b in pairs], repeat)
+        yield _result("rsa.gcd", params, count, seconds, "ops")
+        seconds = timeit(lambda: [rsa.binary_gcd(a, b) for a, b in pairs], repeat)
+        yield _result("rsa.binary_gcd", params, count, seconds, "ops")
+
+
+def run_benchmarks(
+    sizes: tp.Iterable[int] = SIZES,
+    key_lengths: tp.Iterable[int] = KEY_LENGTHS,
+    rsa_key_bits: tp.Iterable[int] = RSA_KEY_BITS,
+    rsa_sizes: tp.Iterable[int] = RSA_SIZES,
+    repeat: int = 3,
+    prime_bits: tp.Iterable[int] = PRIME_BITS,
+    inverse_counts: tp.Iterable[int] = INVERSE_COUNTS,
+) -> tp.List[Result]:
+    results = list(bench_caesar(sizes, repeat))
+    results.extend(bench_vigenere(sizes, key_lengths, repeat))
+    results.extend(bench_rsa(rsa_sizes, rsa_key_bits, repeat))
+    results.extend(bench_envelope(sorted(set(rsa_sizes) | set(sizes)), rsa_key_bits, repeat))
+    results.extend(bench_primes(prime_bits, repeat))
+    results.extend(bench_inverse(inverse_counts, INVERSE_BITS, repeat))
+    return results
+
+
+def _key(result: Result) -> str:
+    return json.dumps([result["name"], result["params"], result["size"], _metric(result)], sort_keys=True)
+
+
+def compare(results: tp.List[Result], baseline: tp.List[Result], threshold: float = 0.1) -> tp.List[Result]:
+    """
+    Results whose throughput dropped by more than threshold (a fraction) against the baseline.
+    Results are matched with the baseline by name, params, size and unit, so bytes
+    are never compared with operations.
+    Each regression gets the baseline throughput and the relative change added.
+    """
+    previous = {_key(result): result for result in baseline}
+    regressions = []
+    for result in results:
+        metric = _metric(result)
+        old = previous.get(_key(result))
+        if old is None or not old[metric]:
+            continue
+        change = result[metric] / old[metric] - 1
+        if change < -threshold:
+            regressions.append(dict(result, **{f"baseline_{metric}": old[metric], "change": change}))
+    return regressions
+
+
+def _sizes(value: str) -> tp.Tuple[int, ...]:
+    units = {"k": KB, "m": MB}
+    sizes = []
+    for item in value.lower().split(","):
+        item = item.strip()
+        multiplier = units.get(item[-1:], 1)
+        sizes.append(int(item.rstrip("km")) * multiplier)
+    return tuple(sizes)
+
+
+def main(argv: tp.Optional[tp.List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark homework01 ciphers")
+    parser.add_argument("--sizes", type=_sizes, default=SIZES, help="comma separated input sizes, e.g. 1k,64k,1m")
+    parser.add_argument("--key-lengths", type=lambda v: tuple(map(int, v.split(","))), default=KEY_LENGTHS)
+    parser.add_argument("--rsa-bits", type=lambda v: tuple(map(int, v.split(","))), default=RSA_KEY_BITS)
+    parser.add_argument("--rsa-sizes", type=_sizes, default=RSA_SIZES)
+    parser.add_argument("--prime-bits", type=lambda v: tuple(map(int, v.split(","))), default=PRIME_BITS)
+    parser.add_argument("--inverse-counts", type=lambda v: tuple(map(int, v.split(","))), default=INVERSE_COUNTS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=pathlib.Path, help="write JSON results to this file")
+    parser.add_argument("--baseline", type=pathlib.Path, help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1, help="allowed throughput drop, 0.1 is 10%%")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(
+        sizes=args.sizes,
+        key_lengths=args.key_lengths,
+        rsa_key_bits=args.rsa_bits,
+        rsa_sizes=args.rsa_sizes,
+        repeat=args.repeat,
+        prime_bits=args.prime_bits,
+        inverse_counts=args.inverse_counts,
+    )
+    output = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(output)
+    else:
+        print(output)
+
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text()), args.threshold)
+        for regression in regressions:
+            print(
+                f"REGRESSION {regression['name']} {regression['params']} size={regression['size']}: "
+                f"{regression['change']:+.1%}",
+                file=sys.stderr,
+            )
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,36 @@
+import functools
+import pathlib
+import string
+import typing as tp
+
+from homework01.streams import (
+    CHUNK_SIZE,
+    ReadableBuffer,
+    WritableBuffer,
+    map_file,
+    read_chunks,
+)
+
+
+@functools.lru_cache(maxsize=26)
+def _shift_table(shift: int) -> tp.Dict[int, int]:
+    """
+    Builds a str.translate table that moves every latin letter by shift positions.
+    Tables are built lazily and kept in the cache, one for each of the 26 shifts.
+    """
+    upper = string.ascii_uppercase
+    lower = string.ascii_lowercase
+    return str.maketrans(upper + lower, upper[shift:] + upper[:shift] + lower[shift:] + lower[:shift])
+
+
+@functools.lru_cache(maxsize=26)
+def _byte_shift_table(shift: int) -> bytes:
+    """Same as _shift_table but for bytes.translate over ASCII data"""
+    upper = string.ascii_uppercase.encode("ascii")
+    lower = string.ascii_lowercase.encode("ascii")
+    return bytes.maketrans(upper + lower, upper[shift:] + upper[:shift] + lower[shift:] + lower[:shift])
+
+
 def encrypt_caesar(plaintext: str, shift: int = 3) -> str:
     """
     Encrypts plaintext using a Caesar cipher.
@@ -10,20 +43,7 @@ def encrypt_caesar(plaintext: str, shift: int = 3) -> str:
     >>> encrypt_caesar("")
     ''
     """
-    ciphertext = ""
-    for char in plaintext:
-        if "A" <= char <= "Z":
-            shifted = ord(char) - ord("A")
-            shifted = (shifted + shift) % 26
-            ciphertext += chr(ord("A") + shifted)
-        elif "a" <= char <= "z":
-            shifted = ord(char) - ord("a")
-            shifted = (shifted + shift) % 26
-            ciphertext += chr(ord("a") + shifted)
-        else:
-            ciphertext += char
-
-    return ciphertext
+    return plaintext.translate(_shift_table(shift % 26))
 
 
 def decrypt_caesar(ciphertext: str, shift: int = 3) -> str:
@@ -38,18 +58,101 @@ def decrypt_caesar(ciphertext: str, shift: int = 3) -> str:
     >>> decrypt_caesar("")
     ''
     """
-    plaintext = ""
-    plaintext = ""
-
-    for char in ciphertext:
-        if "A" <= char <= "Z":
-            shifted = ord(char) - ord("A")
-            shifted = (shifted - shift) % 26
-            plaintext += chr(ord("A") + shifted)
-        elif "a" <= char <= "z":
-            shifted = ord(char) - ord("a")
-            shifted = (shifted - shift) % 26
-            plaintext += chr(ord("a") + shifted)
-        else:
-            plaintext += char
-    return plaintext
+    return ciphertext.translate(_shift_table(-shift % 26))
+
+
+def encrypt_caesar_stream(chunks: tp.Iterable[str], shift: int = 3) -> tp.Iterator[str]:
+    """
+    Encrypts a stream of text chunks, yielding one encrypted chunk per input chunk.
+    >>> list(encrypt_caesar_stream(["PYT", "HON"]))
+    ['SBW', 'KRQ']
+    """
+    table = _shift_table(shift % 26)
+    for chunk in chunks:
+        yield chunk.translate(table)
+
+
+def decrypt_caesar_stream(chunks: tp.Iterable[str], shift: int = 3) -> tp.Iterator[str]:
+    """
+    Decrypts a stream of text chunks, yielding one decrypted chunk per input chunk.
+    >>> list(decrypt_caesar_stream(["SBW", "KRQ"]))
+    ['PYT', 'HON']
+    """
+    table = _shift_table(-shift % 26)
+    for chunk in chunks:
+        yield chunk.translate(table)
+
+
+def encrypt_caesar_file(
+    src: tp.Union[str, pathlib.Path],
+    dst: tp.Union[str, pathlib.Path],
+    shift: int = 3,
+    chunk_size: int = CHUNK_SIZE,
+) -> None:
+    """Encrypts the file src into the file dst without loading it into memory"""
+    with pathlib.Path(src).open(newline="") as fin, pathlib.Path(dst).open("w", newline="") as fout:
+        fout.writelines(encrypt_caesar_stream(read_chunks(fin, chunk_size), shift))
+
+
+def decrypt_caesar_file(
+    src: tp.Union[str, pathlib.Path],
+    dst: tp.Union[str, pathlib.Path],
+    shift: int = 3,
+    chunk_size: int = CHUNK_SIZE,
+) -> None:
+    """Decrypts the file src into the file dst without loading it into memory"""
+    with pathlib.Path(src).open(newline="") as fin, pathlib.Path(dst).open("w", newline="") as fout:
+        fout.writelines(decrypt_caesar_stream(read_chunks(fin, chunk_size), shift))
+
+
+def encrypt_caesar_bytes(plaintext: ReadableBuffer, shift: int = 3) -> bytes:
+    """
+    Encrypts ASCII bytes using a Caesar cipher.
+    >>> encrypt_caesar_bytes(b"Python3.6")
+    b'Sbwkrq3.6'
+    """
+    return bytes(plaintext).translate(_byte_shift_table(shift % 26))
+
+
+def decrypt_caesar_bytes(ciphertext: ReadableBuffer, shift: int = 3) -> bytes:
+    """
+    Decrypts ASCII bytes using a Caesar cipher.
+    >>> decrypt_caesar_bytes(b"Sbwkrq3.6")
+    b'Python3.6'
+    """
+    return bytes(ciphertext).translate(_byte_shift_table(-shift % 26))
+
+
+def _translate_inplace(buffer: WritableBuffer, table: bytes, chunk_size: int) -> None:
+    with memoryview(buffer) as view:
+        for start in range(0, len(view), chunk_size):
+            chunk = view[start : start + chunk_size]
+            chunk[:] = chunk.tobytes().translate(table)
+
+
+def encrypt_caesar_inplace(buffer: WritableBuffer, shift: int = 3, chunk_size: int = CHUNK_SIZE) -> None:
+    """
+    Encrypts a writable ASCII buffer (bytearray, memoryview, mmap) in place, chunk by chunk.
+    >>> data = bytearray(b"PYTHON")
+    >>> encrypt_caesar_inplace(data)
+    >>> data
+    bytearray(b'SBWKRQ')
+    """
+    _translate_inplace(buffer, _byte_shift_table(shift % 26), chunk_size)
+
+
+def decrypt_caesar_inplace(buffer: WritableBuffer, shift: int = 3, chunk_size: int = CHUNK_SIZE) -> None:
+    """Decrypts a writable ASCII buffer (bytearray, memoryview, mmap) in place, chunk by chunk"""
+    _translate_inplace(buffer, _byte_shift_table(-shift % 26), chunk_size)
+
+
+def encrypt_caesar_mmap(path: tp.Union[str, pathlib.Path], shift: int = 3, chunk_size: int = CHUNK_SIZE) -> None:
+    """Encrypts an ASCII file in place through mmap without reading it into memory"""
+    with map_file(path) as buffer:
+        encrypt_caesar_inplace(buffer, shift, chunk_size)
+
+
+def decrypt_caesar_mmap(path: tp.Union[str, pathlib.Path], shift: int = 3, chunk_size: int = CHUNK_SIZE) -> None:
+    """Decrypts an ASCII file in place through mmap without reading it into memory"""
+    with map_file(path) as buffer:
+        decrypt_caesar_inplace(buffer, shift, chunk_size)
@@ -0,0 +1,185 @@
+"""
+Binary container for RSA keys and ciphertext.
+
+Container layout: the 4-byte magic, then records. A record is a 1-byte kind,
+a 4-byte big-endian payload length and the payload. A KEY record holds the key
+numbers, each as a 4-byte length and a big-endian integer. A BLOCKS record holds
+the output of rsa.encrypt_blocks for one chunk of plaintext, so every record is
+decrypted on its own and the reader never needs more than one record in memory.
+"""
+
+import contextlib
+import mmap
+import os
+import pathlib
+import typing as tp
+
+from homework01 import rsa
+from homework01.streams import CHUNK_SIZE, ReadableBuffer
+
+MAGIC = b"RSA\x01"
+LENGTH_SIZE = 4
+RECORD_HEADER_SIZE = 1 + LENGTH_SIZE
+
+KEY = 1
+BLOCKS = 2
+
+
+def pack_ints(values: tp.Iterable[int], width: int) -> bytes:
+    """
+    Packs non-negative integers into fixed-width big-endian fields.
+
+    >>> pack_ints([1, 258], 2)
+    b'\\x00\\x01\\x01\\x02'
+    """
+    return b"".join(value.to_bytes(width, "big") for value in values)
+
+
+def unpack_ints(data: ReadableBuffer, width: int) -> tp.List[int]:
+    """
+    Unpacks integers packed by pack_ints.
+
+    >>> unpack_ints(b'\\x00\\x01\\x01\\x02', 2)
+    [1, 258]
+    """
+    view = memoryview(data)
+    if len(view) % width:
+        raise ValueError("Packed data is not a whole number of fields")
+    return [int.from_bytes(view[i : i + width], "big") for i in range(0, len(view), width)]
+
+
+def dump_key(pk: rsa.Key) -> bytes:
+    """
+    Serializes a key tuple or a CRTKey.
+
+    >>> load_key(dump_key((5, 323)))
+    (5, 323)
+    """
+    parts = []
+    for value in pk:
+        number = value.to_bytes((value.bit_length() + 7) // 8, "big")
+        parts.append(len(number).to_bytes(LENGTH_SIZE, "big") + number)
+    return b"".join(parts)
+
+
+def load_key(data: ReadableBuffer) -> rsa.Key:
+    """Restores a key serialized by dump_key"""
+    view = memoryview(data)
+    values = []
+    pos = 0
+    while pos < len(view):
+        end = pos + LENGTH_SIZE + int.from_bytes(view[pos : pos + LENGTH_SIZE], "big")
+        if pos + LENGTH_SIZE > len(view) or end > len(view):
+            raise ValueError("Key data is truncated")
+        values.append(int.from_bytes(view[pos + LENGTH_SIZE : end], "big"))
+        pos = end
+    if len(values) == 2:
+        return values[0], values[1]
+    if len(values) == len(rsa.CRTKey._fields):
+        return rsa.CRTKey(*values)
+    raise ValueError(f"Key has {len(values)} numbers, expected 2 or {len(rsa.CRTKey._fields)}")
+
+
+class ContainerWriter:
+    """Writes container records to a binary file object one at a time"""
+
+    def __init__(self, f: tp.BinaryIO) -> None:
+        self.f = f
+        self.f.write(MAGIC)
+
+    def write_record(self, kind: int, payload: ReadableBuffer) -> None:
+        self.f.write(bytes([kind]) + len(payload).to_bytes(LENGTH_SIZE, "big"))
+        self.f.write(payload)
+
+    def write_key(self, pk: rsa.Key) -> None:
+        self.write_record(KEY, dump_key(pk))
+
+    def write_blocks(self, pk: rsa.Key, plaintext: bytes) -> None:
+        """Encrypts plaintext with rsa.encrypt_blocks and writes it as one record"""
+        self.write_record(BLOCKS, rsa.encrypt_blocks(pk, plaintext))
+
+
+def iter_records(buffer: ReadableBuffer) -> tp.Iterator[tp.Tuple[int, bytes]]:
+    """Yields (kind, payload) for every record of a container held in a buffer"""
+    with memoryview(buffer) as view:
+        if view[: len(MAGIC)] != MAGIC:
+            raise ValueError("Not a container: bad magic")
+        pos = len(MAGIC)
+        while pos < len(view):
+            if pos + RECORD_HEADER_SIZE > len(view):
+                raise ValueError("Record header is truncated")
+            kind = view[pos]
+            end = pos + RECORD_HEADER_SIZE + int.from_bytes(view[pos + 1 : pos + RECORD_HEADER_SIZE], "big")
+            if end > len(view):
+                raise ValueError("Record payload is truncated")
+            yield kind, bytes(view[pos + RECORD_HEADER_SIZE : end])
+            pos = end
+
+
+@contextlib.contextmanager
+def _map_readonly(path: tp.Union[str, pathlib.Path]) -> tp.Iterator[ReadableBuffer]:
+    with pathlib.Path(path).open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def read_records(path: tp.Union[str, pathlib.Path]) -> tp.Iterator[tp.Tuple[int, bytes]]:
+    """Memory-maps the container file and yields its records lazily, one payload copy at a time"""
+    with _map_readonly(path) as mapped:
+        yield from iter_records(mapped)
+
+
+def save_key(pk: rsa.Key, path: tp.Union[str, pathlib.Path]) -> None:
+    """Writes the key into a container file with a single KEY record"""
+    with pathlib.Path(path).open("wb") as f:
+        ContainerWriter(f).write_key(pk)
+
+
+def read_key(path: tp.Union[str, pathlib.Path]) -> rsa.Key:
+    """Reads the first KEY record of a container file"""
+    for kind, payload in read_records(path):
+        if kind == KEY:
+            return load_key(payload)
+    raise ValueError("Container has no key record")
+
+
+def encrypt_file(
+    pk: rsa.Key,
+    src: tp.Union[str, pathlib.Path],
+    dst: tp.Union[str, pathlib.Path],
+    chunk_size: int = CHUNK_SIZE,
+) -> None:
+    """
+    Encrypts the file src into the container file dst, one BLOCKS record per chunk.
+    The chunk size is rounded down to whole RSA blocks, so no block is padded more than needed.
+    """
+    capacity = rsa.block_capacity(pk)
+    if capacity < 1:
+        raise ValueError(f"The modulus is too small for block mode, it needs at least {rsa.PADDING_OVERHEAD + 1} bytes")
+    chunk_size = max(capacity, chunk_size // capacity * capacity)
+    with pathlib.Path(src).open("rb") as fin, pathlib.Path(dst).open("wb") as fout:
+        writer = ContainerWriter(fout)
+        while True:
+            chunk = fin.read(chunk_size)
+            if not chunk:
+                return
+            writer.write_blocks(pk, chunk)
+
+
+def decrypt_file(
+    pk: rsa.Key,
+    src: tp.Union[str, pathlib.Path],
+    dst: tp.Union[str, pathlib.Path],
+    e: tp.Optional[int] = None,
+) -> None:
+    """
+    Decrypts the container file src into dst without loading the container into memory.
+    The public exponent e turns on blinding in rsa.decrypt_blocks.
+    """
+    with pathlib.Path(dst).open("wb") as fout:
+        for kind, payload in read_records(src):
+            if kind == BLOCKS:
+                fout.write(rsa.decrypt_blocks(pk, payload, e))
@@ -0,0 +1,255 @@
+import collections
+import pathlib
+import string
+import typing as tp
+
+from homework01.streams import CHUNK_SIZE, read_chunks
+from homework01.vigenere import decrypt_vigenere
+
+# Relative frequencies of the letters A..Z in English text
+ENGLISH_FREQUENCIES = [
+    0.08167,
+    0.01492,
+    0.02782,
+    0.04253,
+    0.12702,
+    0.02228,
+    0.02015,
+    0.06094,
+    0.06966,
+    0.00153,
+    0.00772,
+    0.04025,
+    0.02406,
+    0.06749,
+    0.07507,
+    0.01929,
+    0.00095,
+    0.05987,
+    0.06327,
+    0.09056,
+    0.02758,
+    0.00978,
+    0.02360,
+    0.00150,
+    0.01974,
+    0.00074,
+]
+
+
+def letter_histogram(text: str) -> tp.List[int]:
+    """
+    Counts latin letters of text in one pass, ignoring case.
+    >>> letter_histogram("Abba!")[:3]
+    [2, 2, 0]
+    """
+    counts = collections.Counter(text)
+    return [counts[upper] + counts[lower] for upper, lower in zip(string.ascii_uppercase, string.ascii_lowercase)]
+
+
+def chi_squared(histogram: tp.Sequence[int], profile: tp.Sequence[float] = ENGLISH_FREQUENCIES) -> float:
+    """Pearson's chi-squared statistic of histogram against the expected letter profile"""
+    total = sum(histogram)
+    if total == 0:
+        return 0.0
+    return sum((observed - total * p) ** 2 / (total * p) for observed, p in zip(histogram, profile))
+
+
+def score_shifts(histogram: tp.Sequence[int], profile: tp.Sequence[float] = ENGLISH_FREQUENCIES) -> tp.List[float]:
+    """
+    Scores every Caesar shift of a ciphertext histogram, lower is better.
+    Decrypting with shift s moves the count of letter i + s to letter i,
+    so each candidate is just a rotation of the same histogram.
+    """
+    return [chi_squared(list(histogram[s:]) + list(histogram[:s]), profile) for s in range(26)]
+
+
+def crack_caesar(
+    ciphertext: str,
+    sample_size: tp.Optional[int] = None,
+    profile: tp.Sequence[float] = ENGLISH_FREQUENCIES,
+) -> int:
+    """
+    Finds the most probable shift of a Caesar ciphertext.
+    If sample_size is given only the first sample_size characters are analysed.
+    >>> crack_caesar("Wkh txlfn eurzq ira mxpsv ryhu wkh odcb grj")
+    3
+    """
+    if sample_size is not None:
+        ciphertext = ciphertext[:sample_size]
+    scores = score_shifts(letter_histogram(ciphertext), profile)
+    return min(range(26), key=scores.__getitem__)
+
+
+def crack_caesar_stream(
+    chunks: tp.Iterable[str],
+    sample_size: tp.Optional[int] = None,
+    profile: tp.Sequence[float] = ENGLISH_FREQUENCIES,
+) -> int:
+    """Finds the most probable shift reading chunks until sample_size characters are seen"""
+    histogram = [0] * 26
+    seen = 0
+    for chunk in chunks:
+        if sample_size is not None:
+            chunk = chunk[: sample_size - seen]
+        histogram = [a + b for a, b in zip(histogram, letter_histogram(chunk))]
+        seen += len(chunk)
+        if sample_size is not None and seen >= sample_size:
+            break
+    scores = score_shifts(histogram, profile)
+    return min(range(26), key=scores.__getitem__)
+
+
+def crack_caesar_file(
+    path: tp.Union[str, pathlib.Path],
+    sample_size: tp.Optional[int] = 64 * 1024,
+    profile: tp.Sequence[float] = ENGLISH_FREQUENCIES,
+) -> int:
+    """Finds the most probable shift of a Caesar encrypted file looking only at its first sample_size characters"""
+    with pathlib.Path(path).open() as f:
+        chunk_size = CHUNK_SIZE if sample_size is None else min(CHUNK_SIZE, max(sample_size, 1))
+        return crack_caesar_stream(read_chunks(f, chunk_size), sample_size, profile)
+
+
+# Index of coincidence of uniformly random letters
+RANDOM_IC = 1 / 26
+
+
+def _letter_codes() -> bytes:
+    """Translation table mapping latin letters to their alphabet index and every other byte to 26"""
+    codes = bytearray([26] * 256)
+    for i in range(26):
+        codes[ord("A") + i] = codes[ord("a") + i] = i
+    return bytes(codes)
+
+
+_LETTER_CODES = _letter_codes()
+
+
+def _encode_letters(text: str) -> bytes:
+    """
+    Turns text into one byte per character: the letter index 0..25 or 26 for non-letters.
+    Positions are preserved, so the byte at i belongs to key column i % key_length.
+    """
+    return text.encode("ascii", "replace").translate(_LETTER_CODES)
+
+
+def _column_histograms(codes: bytes, key_length: int) -> tp.List[tp.List[int]]:
+    histograms = []
+    for j in range(key_length):
+        counts = collections.Counter(codes[j::key_length])
+        histograms.append([counts[i] for i in range(26)])
+    return histograms
+
+
+def index_of_coincidence(histogram: tp.Sequence[int]) -> float:
+    """
+    Probability that two letters drawn from the histogram are equal.
+    >>> index_of_coincidence([2, 2] + [0] * 24)
+    0.3333333333333333
+    """
+    total = sum(histogram)
+    if total < 2:
+        return 0.0
+    return sum(c * (c - 1) for c in histogram) / (total * (total - 1))
+
+
+def kasiski_distances(ciphertext: str, sample_size: tp.Optional[int] = 64 * 1024) -> tp.List[int]:
+    """Distances between consecutive occurrences of repeated letter trigrams"""
+    codes = _encode_letters(ciphertext[:sample_size])
+    last_seen: tp.Dict[bytes, int] = {}
+    distances = []
+    for i in range(len(codes) - 2):
+        trigram = codes[i : i + 3]
+        if 26 in trigram:
+            continue
+        if trigram in last_seen:
+            distances.append(i - last_seen[trigram])
+        last_seen[trigram] = i
+    return distances
+
+
+def key_length_scores(
+    ciphertext: str,
+    max_length: int = 100,
+    sample_size: tp.Optional[int] = 64 * 1024,
+) -> tp.List[float]:
+    """
+    Average index of coincidence of the key columns for every key length 1..max_length,
+    the score of key length L is at index L - 1.
+    """
+    codes = _encode_letters(ciphertext[:sample_size])
+    scores = []
+    for key_length in range(1, max_length + 1):
+        histograms = _column_histograms(codes, key_length)
+        scores.append(sum(index_of_coincidence(h) for h in histograms) / key_length)
+    return scores
+
+
+def _plain_text_ic(profile: tp.Sequence[float]) -> float:
+    """Index of coincidence above which letters are taken for plain text rather than random ones"""
+    return RANDOM_IC + 0.75 * (sum(p * p for p in profile) - RANDOM_IC)
+
+
+def estimate_key_lengths(
+    ciphertext: str,
+    max_length: int = 100,
+    sample_size: tp.Optional[int] = 64 * 1024,
+    profile: tp.Sequence[float] = ENGLISH_FREQUENCIES,
+) -> tp.List[int]:
+    """
+    Key lengths whose index of coincidence looks like plain text, most probable first.
+    Multiples of the real key length score as well, so they are ordered by the number
+    of Kasiski distances they divide and then by length.
+    """
+    scores = key_length_scores(ciphertext, max_length, sample_size)
+    threshold = min(_plain_text_ic(profile), max(scores))
+    candidates = [length for length, score in enumerate(scores, 1) if score >= threshold]
+    distances = kasiski_distances(ciphertext, sample_size)
+    support = {length: sum(1 for d in distances if d % length == 0) for length in candidates}
+    return sorted(candidates, key=lambda length: (-support[length], length))
+
+
+def _shortest_period(key: str) -> str:
+    for length in range(1, len(key) + 1):
+        if len(key) % length == 0 and key[:length] * (len(key) // length) == key:
+            return key[:length]
+    return key
+
+
+def recover_key(
+    ciphertext: str,
+    key_length: int,
+    profile: tp.Sequence[float] = ENGLISH_FREQUENCIES,
+) -> str:
+    """Recovers each key letter with the Caesar frequency analysis of its column"""
+    histograms = _column_histograms(_encode_letters(ciphertext), key_length)
+    key = ""
+    for histogram in histograms:
+        scores = score_shifts(histogram, profile)
+        key += chr(ord("A") + min(range(26), key=scores.__getitem__))
+    return _shortest_period(key)
+
+
+def crack_vigenere(
+    ciphertext: str,
+    max_length: int = 100,
+    sample_size: tp.Optional[int] = 64 * 1024,
+    candidates: int = 5,
+    profile: tp.Sequence[float] = ENGLISH_FREQUENCIES,
+) -> str:
+    """
+    Finds the most probable key of a Vigenere ciphertext.
+    A key for each of the best key lengths is verified by decrypting the sample:
+    a wrong key mixes several Caesar shifts and lowers the index of coincidence
+    of the result, so the shortest key scoring close to the best one is returned.
+    """
+    sample = ciphertext[:sample_size]
+    scored = []
+    for key_length in estimate_key_lengths(ciphertext, max_length, sample_size, profile)[:candidates]:
+        key = recover_key(ciphertext, key_length, profile)
+        scored.append((key, index_of_coincidence(letter_histogram(decrypt_vigenere(sample, key)))))
+    if not scored:
+        return "A"
+    best = max(score for _, score in scored)
+    return min((key for key, score in scored if score >= 0.95 * best), key=len)
@@ -0,0 +1,103 @@
+"""
+Hybrid encryption: RSA wraps a random session key, the payload is encrypted
+with the byte Vigenere keystream (vigenere_xor) under that key.
+The keystream repeats with the period of the session key, so this is a fast
+local primitive for large payloads, not a replacement for a real stream cipher.
+
+Envelope layout: 4-byte big-endian length of the wrapped key, the key wrapped
+with rsa.encrypt_blocks, then the encrypted payload of the same length as the
+plaintext.
+"""
+
+import pathlib
+import secrets
+import typing as tp
+
+from homework01 import rsa
+from homework01.streams import CHUNK_SIZE, read_chunks
+from homework01.vigenere import vigenere_xor
+
+SESSION_KEY_SIZE = 1024
+LENGTH_SIZE = 4
+
+
+def _header(pk: rsa.Key, session_key: bytes) -> bytes:
+    wrapped = rsa.encrypt_blocks(pk, session_key)
+    return len(wrapped).to_bytes(LENGTH_SIZE, "big") + wrapped
+
+
+def seal_stream(
+    pk: rsa.Key,
+    chunks: tp.Iterable[bytes],
+    session_key_size: int = SESSION_KEY_SIZE,
+) -> tp.Iterator[bytes]:
+    """Encrypts a stream of byte chunks, yielding the envelope header and then one chunk per input chunk"""
+    session_key = secrets.token_bytes(session_key_size)
+    yield _header(pk, session_key)
+    offset = 0
+    for chunk in chunks:
+        yield vigenere_xor(chunk, session_key, offset)
+        offset += len(chunk)
+
+
+def unseal_stream(pk: rsa.Key, chunks: tp.Iterable[bytes], e: tp.Optional[int] = None) -> tp.Iterator[bytes]:
+    """
+    Decrypts a stream of envelope chunks, the chunks may split the header anywhere.
+    The public exponent e turns on blinding when the session key is unwrapped.
+    """
+    chunks = iter(chunks)
+    buffer = bytearray()
+    header_size = LENGTH_SIZE
+    for chunk in chunks:
+        buffer += chunk
+        if len(buffer) >= LENGTH_SIZE:
+            header_size = LENGTH_SIZE + int.from_bytes(buffer[:LENGTH_SIZE], "big")
+            if len(buffer) >= header_size:
+                break
+    else:
+        raise ValueError("Envelope header is truncated")
+    session_key = rsa.decrypt_blocks(pk, bytes(buffer[LENGTH_SIZE:header_size]), e)
+    if not session_key:
+        raise ValueError("Envelope session key is empty")
+
+    rest = bytes(buffer[header_size:])
+    if rest:
+        yield vigenere_xor(rest, session_key)
+    offset = len(rest)
+    for chunk in chunks:
+        yield vigenere_xor(chunk, session_key, offset)
+        offset += len(chunk)
+
+
+def seal(pk: rsa.Key, plaintext: bytes, session_key_size: int = SESSION_KEY_SIZE) -> bytes:
+    """Encrypts bytes into an envelope"""
+    return b"".join(seal_stream(pk, [plaintext], session_key_size))
+
+
+def unseal(pk: rsa.Key, envelope: bytes, e: tp.Optional[int] = None) -> bytes:
+    """Decrypts an envelope made by seal"""
+    return b"".join(unseal_stream(pk, [envelope], e))
+
+
+def seal_file(
+    pk: rsa.Key,
+    src: tp.Union[str, pathlib.Path],
+    dst: tp.Union[str, pathlib.Path],
+    chunk_size: int = CHUNK_SIZE,
+    session_key_size: int = SESSION_KEY_SIZE,
+) -> None:
+    """Encrypts the file src into the envelope file dst without loading it into memory"""
+    with pathlib.Path(src).open("rb") as fin, pathlib.Path(dst).open("wb") as fout:
+        fout.writelines(seal_stream(pk, read_chunks(fin, chunk_size), session_key_size))
+
+
+def unseal_file(
+    pk: rsa.Key,
+    src: tp.Union[str, pathlib.Path],
+    dst: tp.Union[str, pathlib.Path],
+    chunk_size: int = CHUNK_SIZE,
+    e: tp.Optional[int] = None,
+) -> None:
+    """Decrypts the envelope file src into the file dst without loading it into memory"""
+    with pathlib.Path(src).open("rb") as fin, pathlib.Path(dst).open("wb") as fout:
+        fout.writelines(unseal_stream(pk, read_chunks(fin, chunk_size), e))
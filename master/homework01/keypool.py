@@ -0,0 +1,118 @@
+import concurrent.futures
+import queue
+import threading
+import time
+import typing as tp
+
+from homework01 import rsa
+
+Keypair = tp.Tuple[tp.Tuple[int, int], rsa.CRTKey]
+
+# The smallest modulus whose rsa.encrypt_blocks blocks carry at least one byte
+MIN_BITS = 8 * (rsa.PADDING_OVERHEAD + 1)
+
+
+class KeypairPool:
+    """
+    Bounded pool of pre-generated RSA keypairs.
+    A background thread refills the pool up to size whenever the number of ready
+    keypairs drops to refill_at, generating them on worker processes (or threads),
+    so get() normally returns a keypair that is already waiting.
+    If a generation fails, refilling stops and get() raises the error once the pool runs dry.
+    """
+
+    def __init__(
+        self,
+        bits: int = 2048,
+        size: int = 8,
+        refill_at: int = 2,
+        workers: tp.Optional[int] = None,
+        e: int = rsa.PUBLIC_EXPONENT,
+        processes: bool = True,
+    ) -> None:
+        if not 0 <= refill_at < size:
+            raise ValueError("refill_at must be between 0 and size - 1")
+        if bits < MIN_BITS:
+            raise ValueError(f"bits must be at least {MIN_BITS}, got {bits}")
+        if e.bit_length() >= bits:
+            raise ValueError(f"e = {e} does not fit below a {bits}-bit modulus")
+        self.bits = bits
+        self.size = size
+        self.refill_at = refill_at
+        self.e = e
+        self._keypairs: "queue.Queue[Keypair]" = queue.Queue(maxsize=size)
+        self._executor: concurrent.futures.Executor
+        if processes:
+            self._executor = concurrent.futures.ProcessPoolExecutor(workers)
+        else:
+            self._executor = concurrent.futures.ThreadPoolExecutor(workers)
+        self._low = threading.Event()
+        self._low.set()
+        self._closed = threading.Event()
+        self._error: tp.Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._refill, daemon=True)
+        self._thread.start()
+
+    def _refill(self) -> None:
+        while True:
+            self._low.wait()
+            if self._closed.is_set():
+                return
+            self._low.clear()
+            missing = self.size - self._keypairs.qsize()
+            pending = {self._executor.submit(rsa.generate_rsa_keypair, self.bits, self.e) for _ in range(missing)}
+            while pending:
+                # Poll instead of blocking, so close() does not wait for the whole refill
+                done, pending = concurrent.futures.wait(
+                    pending, timeout=0.1, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                if self._closed.is_set():
+                    return
+                for future in done:
+                    try:
+                        self._keypairs.put_nowait(future.result())
+                    except queue.Full:
+                        pass
+                    except Exception as error:  # pylint: disable=broad-except
+                        self._error = error
+                        for other in pending:
+                            other.cancel()
+                        return
+            if self._keypairs.qsize() <= self.refill_at:
+                self._low.set()
+
+    def get(self, timeout: tp.Optional[float] = None) -> Keypair:
+        """Takes a keypair from the pool, waiting up to timeout seconds if it is empty"""
+        if self._closed.is_set():
+            raise RuntimeError("The pool is closed")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            # Wake up now and then to notice a failed refill instead of waiting forever
+            wait = 0.1 if deadline is None else min(0.1, max(0.0, deadline - time.monotonic()))
+            try:
+                keypair = self._keypairs.get(timeout=wait)
+                break
+            except queue.Empty:
+                if self._error is not None:
+                    raise self._error from None
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise
+        if self._keypairs.qsize() <= self.refill_at:
+            self._low.set()
+        return keypair
+
+    def __len__(self) -> int:
+        """Number of keypairs ready to be taken"""
+        return self._keypairs.qsize()
+
+    def close(self) -> None:
+        self._closed.set()
+        self._low.set()
+        self._thread.join()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> "KeypairPool":
+        return self
+
+    def __exit__(self, *args: tp.Any) -> None:
+        self.close()
@@ -1,10 +1,89 @@
+import math
 import random
+import secrets
 import typing as tp
 
+from homework01.sieve import PrimeSieve
 
-def is_prime(n: int) -> bool:
+
+class CRTKey(tp.NamedTuple):
+    """Private key extended with the factors of n for Chinese remainder theorem decryption"""
+
+    d: int
+    n: int
+    p: int
+    q: int
+    dp: int
+    dq: int
+    qinv: int
+
+
+Key = tp.Union[tp.Tuple[int, int], CRTKey]
+
+
+def _small_primes(limit: int) -> tp.List[int]:
+    sieve = bytearray([1]) * limit
+    sieve[0:2] = b"\x00\x00"
+    for i in range(2, int(limit**0.5) + 1):
+        if sieve[i]:
+            sieve[i * i :: i] = bytes(len(range(i * i, limit, i)))
+    return [i for i in range(limit) if sieve[i]]
+
+
+SMALL_PRIMES = _small_primes(1 << 13)
+SMALL_PRIMES_SET = frozenset(SMALL_PRIMES)
+SMALL_PRIMES_PRODUCT = math.prod(SMALL_PRIMES)
+
+# Miller-Rabin with these bases is exact for every n < 3.3 * 10^24
+DETERMINISTIC_BASES = SMALL_PRIMES[:13]
+DETERMINISTIC_LIMIT = 3317044064679887385961981
+
+
+# Table used by is_prime for the numbers below its max_limit, see use_prime_sieve
+_prime_sieve: tp.Optional[PrimeSieve] = None
+
+
+def use_prime_sieve(sieve: tp.Optional[PrimeSieve]) -> None:
+    """
+    Makes is_prime answer from the sieve for numbers below sieve.max_limit, None turns it off.
+    >>> use_prime_sieve(PrimeSieve(10**6))
+    >>> is_prime(999983)
+    True
+    >>> use_prime_sieve(None)
+    """
+    global _prime_sieve  # pylint: disable=global-statement
+    _prime_sieve = sieve
+
+
+def _miller_rabin(n: int, bases: tp.Iterable[int]) -> bool:
+    """Miller-Rabin test of an odd n > 3, False means n is certainly composite"""
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    for a in bases:
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = pow(x, 2, n)
+            if x == n - 1:
+                break
+        else:
+            return False
+
+    return True
+
+
+def is_prime(n: int, rounds: int = 40) -> bool:
     """
     Tests to see if a number is prime.
+    Numbers covered by the sieve set with use_prime_sieve are looked up in it.
+    Otherwise small factors are sieved out with a single gcd against the product
+    of primes below 8192, then the Miller-Rabin test is run with fixed bases
+    (exact below 3.3 * 10^24) or rounds random bases.
     >>> is_prime(2)
     True
     >>> is_prime(11)
@@ -15,18 +94,51 @@ def is_prime(n: int) -> bool:
     if n < 2:
         return False
 
-    if n == 2:
-        return True
+    if _prime_sieve is not None and n < _prime_sieve.max_limit:
+        return _prime_sieve.is_prime(n)
 
-    if n % 2 == 0:
+    if n <= SMALL_PRIMES[-1]:
+        return n in SMALL_PRIMES_SET
+    if math.gcd(n, SMALL_PRIMES_PRODUCT) != 1:
         return False
+    if n < SMALL_PRIMES[-1] ** 2:
+        return True
 
-    limit = int(n**0.5) + 1
-    for i in range(3, limit, 2):
-        if n % i == 0:
-            return False
+    if n < DETERMINISTIC_LIMIT:
+        return _miller_rabin(n, DETERMINISTIC_BASES)
+    rnd = random.SystemRandom()
+    return _miller_rabin(n, (rnd.randrange(2, n - 1) for _ in range(rounds)))
 
-    return True
+
+def _generation_rounds(bits: int) -> int:
+    """
+    Miller-Rabin rounds for a random candidate of the given size.
+    A random composite passes a round far less often than the worst case 1/4,
+    so big random candidates need only a few rounds for an error below 2^-100.
+    """
+    if bits >= 1024:
+        return 5
+    if bits >= 512:
+        return 8
+    return 40
+
+
+def generate_prime(bits: int) -> int:
+    """
+    Generates a random prime of exactly bits bits.
+    The two highest bits are set, so the product of two such primes has 2 * bits bits.
+    >>> generate_prime(64).bit_length()
+    64
+    """
+    if bits < 2:
+        raise ValueError("A prime has at least 2 bits")
+    if bits == 2:
+        return random.SystemRandom().choice([2, 3])
+    rounds = _generation_rounds(bits)
+    while True:
+        candidate = secrets.randbits(bits) | (3 << (bits - 2)) | 1
+        if is_prime(candidate, rounds):
+            return candidate
 
 
 def gcd(a: int, b: int) -> int:
@@ -64,38 +176,261 @@ def multiplicative_inverse(e: int, phi: int) -> int:
     return d
 
 
-def generate_keypair(p: int, q: int) -> tp.Tuple[tp.Tuple[int, int], tp.Tuple[int, int]]:
+def binary_gcd(a: int, b: int) -> int:
+    """
+    Stein's binary algorithm for the greatest common divisor.
+    Only shifts and subtractions are used, every run of trailing zero bits is
+    stripped at once with the x & -x trick.
+    >>> binary_gcd(12, 15)
+    3
+    >>> binary_gcd(0, 9)
+    9
+    """
+    a, b = abs(a), abs(b)
+    if a == 0 or b == 0:
+        return a | b
+    shift = ((a | b) & -(a | b)).bit_length() - 1
+    a >>= (a & -a).bit_length() - 1
+    while b:
+        b >>= (b & -b).bit_length() - 1
+        if a > b:
+            a, b = b, a
+        b -= a
+    return a << shift
+
+
+def binary_extended_gcd(a: int, b: int) -> tp.Tuple[int, int, int]:
+    """
+    Binary extended Euclidean algorithm, returns (g, x, y) with a * x + b * y = g = gcd(a, b).
+    a and b must be positive.
+    >>> binary_extended_gcd(7, 40)
+    (1, 23, -4)
+    """
+    if a <= 0 or b <= 0:
+        raise ValueError("a and b must be positive")
+    shift = ((a | b) & -(a | b)).bit_length() - 1
+    x, y = a >> shift, b >> shift
+    u, v = x, y
+    # Invariants: a1 * x + b1 * y = u and a2 * x + b2 * y = v
+    a1, b1, a2, b2 = 1, 0, 0, 1
+    while u:
+        while u % 2 == 0:
+            u //= 2
+            if a1 % 2 == 0 and b1 % 2 == 0:
+                a1, b1 = a1 // 2, b1 // 2
+            else:
+                a1, b1 = (a1 + y) // 2, (b1 - x) // 2
+        while v % 2 == 0:
+            v //= 2
+            if a2 % 2 == 0 and b2 % 2 == 0:
+                a2, b2 = a2 // 2, b2 // 2
+            else:
+                a2, b2 = (a2 + y) // 2, (b2 - x) // 2
+        if u >= v:
+            u, a1, b1 = u - v, a1 - a2, b1 - b2
+        else:
+            v, a2, b2 = v - u, a2 - a1, b2 - b1
+    return v << shift, a2, b2
+
+
+def batch_inverse(values: tp.Sequence[int], n: int) -> tp.List[int]:
+    """
+    Inverses of all values modulo n with a single modular inversion (Montgomery's trick):
+    the prefix products are inverted once and unwound with two multiplications per value.
+    >>> batch_inverse([7, 3, 9], 40)
+    [23, 27, 9]
+    """
+    if not values:
+        return []
+    prefix = []
+    product = 1
+    for value in values:
+        product = product * value % n
+        prefix.append(product)
+    if gcd(product, n) != 1:
+        raise ValueError("Some values are not invertible modulo n")
+
+    inverse = multiplicative_inverse(product, n)
+    result = [0] * len(values)
+    for i in range(len(values) - 1, 0, -1):
+        result[i] = inverse * prefix[i - 1] % n
+        inverse = inverse * values[i] % n
+    result[0] = inverse
+    return result
+
+
+# The standard fixed public exponent, 2^16 + 1
+PUBLIC_EXPONENT = 65537
+
+
+def generate_keypair(p: int, q: int, e: tp.Optional[int] = None) -> tp.Tuple[tp.Tuple[int, int], tp.Tuple[int, int]]:
+    """
+    Generates a keypair from the primes p and q.
+    The public exponent is random unless e is given, e.g. PUBLIC_EXPONENT.
+    >>> generate_keypair(17, 19, e=5)
+    ((5, 323), (173, 323))
+    """
     if not (is_prime(p) and is_prime(q)):
         raise ValueError("Both numbers must be prime.")
     elif p == q:
         raise ValueError("p and q cannot be equal")
 
-    n = p * q
     phi = (p - 1) * (q - 1)
-    e = random.randrange(2, phi)
 
-    g = gcd(e, phi)
-    while g != 1:
+    if e is not None:
+        if gcd(e, phi) != 1:
+            raise ValueError(f"e = {e} is not coprime with phi(n)")
+    else:
         e = random.randrange(2, phi)
+
         g = gcd(e, phi)
+        while g != 1:
+            e = random.randrange(2, phi)
+            g = gcd(e, phi)
 
-    d = multiplicative_inverse(e, phi)
+    return _keypair_from_primes(p, q, e)
 
+
+def _keypair_from_primes(p: int, q: int, e: int) -> tp.Tuple[tp.Tuple[int, int], tp.Tuple[int, int]]:
+    """
+    Builds the keypair from primes that are already known to be prime and an e coprime with phi(n).
+    Nothing is checked, so a freshly generated pair is not run through is_prime a second time.
+    >>> _keypair_from_primes(17, 19, 5)
+    ((5, 323), (173, 323))
+    """
+    n = p * q
+    d = multiplicative_inverse(e, (p - 1) * (q - 1))
     return ((e, n), (d, n))
 
 
-def encrypt(pk: tp.Tuple[int, int], plaintext: str) -> tp.List[int]:
+def generate_rsa_keypair(bits: int, e: int = PUBLIC_EXPONENT) -> tp.Tuple[tp.Tuple[int, int], CRTKey]:
+    """
+    Generates a keypair with a modulus of bits bits and the fixed public exponent e.
+    The private key comes with its CRT parameters.
+    """
+    while True:
+        p = generate_prime(bits - bits // 2)
+        q = generate_prime(bits // 2)
+        if p != q and gcd(e, p - 1) == 1 and gcd(e, q - 1) == 1:
+            break
+    public, private = _keypair_from_primes(p, q, e)
+    return public, crt_key(private, p, q)
+
+
+def crt_key(private: tp.Tuple[int, int], p: int, q: int) -> CRTKey:
+    """
+    Extends the private key (d, n) with p, q, d mod (p - 1), d mod (q - 1) and q^-1 mod p.
+    >>> crt_key((169, 323), 17, 19)
+    CRTKey(d=169, n=323, p=17, q=19, dp=9, dq=7, qinv=9)
+    """
+    d, n = private
+    if p * q != n:
+        raise ValueError("p * q must be equal to n")
+    return CRTKey(d, n, p, q, d % (p - 1), d % (q - 1), multiplicative_inverse(q, p))
+
+
+def power(pk: Key, value: int) -> int:
+    """
+    Raises value to the key exponent modulo n.
+    A CRTKey takes two exponentiations modulo p and q with half-size
+    numbers and exponents instead of one modulo n.
+    >>> power((121, 323), 72)
+    276
+    >>> power(crt_key((169, 323), 17, 19), 276)
+    72
+    """
+    if isinstance(pk, CRTKey):
+        m1 = pow(value, pk.dp, pk.p)
+        m2 = pow(value, pk.dq, pk.q)
+        h = pk.qinv * (m1 - m2) % pk.p
+        return m2 + h * pk.q
     key, n = pk
-    cipher = [(ord(char) ** key) % n for char in plaintext]
+    return pow(value, key, n)
+
+
+def encrypt(pk: Key, plaintext: str) -> tp.List[int]:
+    cipher = [power(pk, ord(char)) for char in plaintext]
     return cipher
 
 
-def decrypt(pk: tp.Tuple[int, int], ciphertext: tp.List[int]) -> str:
-    key, n = pk
-    plain = [chr((char**key) % n) for char in ciphertext]
+def decrypt(pk: Key, ciphertext: tp.List[int]) -> str:
+    plain = [chr(power(pk, char)) for char in ciphertext]
     return "".join(plain)
 
 
+# Block padding: 0x00 0x02 <at least 8 random non-zero bytes> 0x00 <message>
+MIN_PADDING = 8
+PADDING_OVERHEAD = MIN_PADDING + 3
+
+
+def block_size(pk: Key) -> int:
+    """
+    Size in bytes of one ciphertext block, the byte length of n.
+    >>> block_size((121, 323))
+    2
+    """
+    return (pk[1].bit_length() + 7) // 8
+
+
+def block_capacity(pk: Key) -> int:
+    """Number of message bytes packed into one block"""
+    return block_size(pk) - PADDING_OVERHEAD
+
+
+def _pad(chunk: bytes, size: int) -> int:
+    padding = bytes(secrets.randbelow(255) + 1 for _ in range(size - len(chunk) - 3))
+    return int.from_bytes(b"\x00\x02" + padding + b"\x00" + chunk, "big")
+
+
+def _unpad(value: int, size: int) -> bytes:
+    block = value.to_bytes(size, "big")
+    separator = block.find(b"\x00", 2)
+    if block[:2] != b"\x00\x02" or separator < 2 + MIN_PADDING:
+        raise ValueError("Invalid block padding")
+    return block[separator + 1 :]
+
+
+def encrypt_blocks(pk: Key, plaintext: bytes) -> bytes:
+    """
+    Encrypts bytes packing up to block_capacity(pk) of them into each padded block.
+    The ciphertext is the concatenation of block_size(pk)-byte big-endian blocks.
+    """
+    size = block_size(pk)
+    capacity = size - PADDING_OVERHEAD
+    if capacity < 1:
+        raise ValueError(f"The modulus is too small for block mode, it needs at least {PADDING_OVERHEAD + 1} bytes")
+    ciphertext = bytearray()
+    for start in range(0, len(plaintext), capacity):
+        value = power(pk, _pad(plaintext[start : start + capacity], size))
+        ciphertext += value.to_bytes(size, "big")
+    return bytes(ciphertext)
+
+
+def decrypt_blocks(pk: Key, ciphertext: bytes, e: tp.Optional[int] = None) -> bytes:
+    """
+    Decrypts the result of encrypt_blocks.
+    If the public exponent e is given, every block c is blinded as c * r^e with a random r,
+    so the timing of the private exponentiation does not depend on the ciphertext.
+    The unblinding factors r^-1 of all blocks come from one batch_inverse call.
+    """
+    size = block_size(pk)
+    if len(ciphertext) % size:
+        raise ValueError(f"Ciphertext length must be a multiple of the block size {size}")
+    n = pk[1]
+    blocks = [int.from_bytes(ciphertext[start : start + size], "big") for start in range(0, len(ciphertext), size)]
+    if e is not None:
+        factors = [secrets.randbelow(n - 2) + 2 for _ in blocks]
+        blocks = [block * pow(r, e, n) % n for block, r in zip(blocks, factors)]
+        unblind = batch_inverse(factors, n)
+    plaintext = bytearray()
+    for i, block in enumerate(blocks):
+        value = power(pk, block)
+        if e is not None:
+            value = value * unblind[i] % n
+        plaintext += _unpad(value, size)
+    return bytes(plaintext)
+
+
 if __name__ == "__main__":
     print("RSA Encrypter/ Decrypter")
     p = int(input("Enter a prime number (17, 19, 23, etc): "))
@@ -106,7 +441,7 @@ if __name__ == "__main__":
     message = input("Enter a message to encrypt with your private key: ")
     encrypted_msg = encrypt(private, message)
     print("Your encrypted message is: ")
-    print("".join(map(lambda x: str(x), encrypted_msg)))
+    print(" ".join(map(str, encrypted_msg)))
     print("Decrypting message with public key ", public, " . . .")
     print("Your message is:")
     print(decrypt(public, encrypted_msg))
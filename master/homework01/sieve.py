@@ -0,0 +1,120 @@
+"""
+Segmented sieve of Eratosthenes stored as a bitset of odd numbers.
+
+Byte i holds the odd numbers 16 * i + 1, 16 * i + 3, ..., 16 * i + 15,
+bit k is set when 16 * i + 2 * k + 1 is composite. The file format is an
+8-byte little-endian limit followed by the bitset, so a saved sieve is
+memory-mapped on load instead of being rebuilt.
+"""
+
+import math
+import mmap
+import pathlib
+import typing as tp
+
+SEGMENT_SIZE = 1 << 20
+HEADER_SIZE = 8
+
+# _OR_TABLES[k] sets bit k of every byte with bytes.translate
+_OR_TABLES = [bytes(b | (1 << k) for b in range(256)) for k in range(8)]
+
+
+def _base_primes(limit: int) -> tp.List[int]:
+    """Odd primes below limit by the plain sieve, used to sieve the segments"""
+    sieve = bytearray([1]) * limit
+    for i in range(3, math.isqrt(limit) + 1, 2):
+        if sieve[i]:
+            sieve[i * i :: 2 * i] = bytes(len(range(i * i, limit, 2 * i)))
+    return [i for i in range(3, limit, 2) if sieve[i]]
+
+
+def _sieve_segment(lo: int, hi: int) -> bytearray:
+    """Composite bits of the odd numbers in [lo, hi), both bounds are multiples of 16"""
+    segment = bytearray((hi - lo) // 16)
+    for p in _base_primes(math.isqrt(hi - 1) + 1):
+        start = max(p * p, (lo + p - 1) // p * p)
+        if start % 2 == 0:
+            start += p
+        # Odd multiples start, start + 2p, ..., start + 14p fall into all 8 bit positions,
+        # and each of them repeats every 16p numbers, that is every p bytes
+        for n in range(start, min(start + 16 * p, hi), 2 * p):
+            index = (n - lo) // 16
+            segment[index::p] = segment[index::p].translate(_OR_TABLES[(n % 16) // 2])
+    if lo == 0:
+        segment[0] |= 1
+    return segment
+
+
+class PrimeSieve:
+    """
+    Primality table for the numbers below max_limit.
+    The table is built segment by segment only as far as queries reach.
+    >>> sieve = PrimeSieve(1000)
+    >>> [n for n in range(30) if sieve.is_prime(n)]
+    [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+    """
+
+    def __init__(self, max_limit: int, segment_size: int = SEGMENT_SIZE) -> None:
+        self.max_limit = max_limit
+        self.segment_size = max(16, segment_size // 16 * 16)
+        self.limit = 0
+        self._bits: tp.Union[bytearray, memoryview] = bytearray()
+        self._mapped: tp.Optional[mmap.mmap] = None
+
+    def extend(self, limit: int) -> None:
+        """Sieves the numbers up to limit, rounded up to a whole segment"""
+        limit = min(self.max_limit, limit)
+        if limit <= self.limit:
+            return
+        hi = min(-(-limit // self.segment_size) * self.segment_size, -(-self.max_limit // 16) * 16)
+        if isinstance(self._bits, memoryview):
+            bits, loaded = bytearray(self._bits), self.limit
+            self.close()
+            self._bits, self.limit = bits, loaded
+        for lo in range(self.limit, hi, self.segment_size):
+            self._bits += _sieve_segment(lo, min(lo + self.segment_size, hi))
+        self.limit = hi
+
+    def is_prime(self, n: int) -> bool:
+        if n < 2:
+            return False
+        if n % 2 == 0:
+            return n == 2
+        if n >= self.max_limit:
+            raise ValueError(f"{n} is above the sieve limit {self.max_limit}")
+        if n >= self.limit:
+            self.extend(n + 1)
+        return not self._bits[n // 16] >> ((n % 16) // 2) & 1
+
+    def __contains__(self, n: int) -> bool:
+        return self.is_prime(n)
+
+    def save(self, path: tp.Union[str, pathlib.Path]) -> None:
+        with pathlib.Path(path).open("wb") as f:
+            f.write(self.limit.to_bytes(HEADER_SIZE, "little"))
+            f.write(self._bits)
+
+    @classmethod
+    def load(cls, path: tp.Union[str, pathlib.Path], max_limit: tp.Optional[int] = None) -> "PrimeSieve":
+        """
+        Memory-maps a saved sieve, the table is paged in by the OS as it is used.
+        Extending the loaded sieve past its saved limit copies it into memory.
+        """
+        with pathlib.Path(path).open("rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        limit = int.from_bytes(mapped[:HEADER_SIZE], "little")
+        sieve = cls(max(limit, max_limit or 0))
+        sieve.limit = limit
+        sieve._bits = memoryview(mapped)[HEADER_SIZE:]
+        sieve._mapped = mapped
+        return sieve
+
+    def close(self) -> None:
+        """Unmaps a loaded sieve, the table is rebuilt by the next queries"""
+        if isinstance(self._bits, memoryview):
+            self._bits.release()
+            self._bits = bytearray()
+            self.limit = 0
+        if self._mapped is not None:
+            self._mapped.close()
+            self._mapped = None
@@ -0,0 +1,37 @@
+"""Chunked file reading and memory-mapping shared by the cipher modules"""
+
+import contextlib
+import mmap
+import os
+import pathlib
+import typing as tp
+
+CHUNK_SIZE = 1 << 16
+
+ReadableBuffer = tp.Union[bytes, bytearray, memoryview, mmap.mmap]
+WritableBuffer = tp.Union[bytearray, memoryview, mmap.mmap]
+
+
+def read_chunks(f: tp.IO[tp.AnyStr], chunk_size: int = CHUNK_SIZE) -> tp.Iterator[tp.AnyStr]:
+    """
+    Reads an opened file by chunks of chunk_size characters, or bytes for a binary file.
+    >>> import io
+    >>> list(read_chunks(io.BytesIO(b"abcde"), 2))
+    [b'ab', b'cd', b'e']
+    """
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+@contextlib.contextmanager
+def map_file(path: tp.Union[str, pathlib.Path]) -> tp.Iterator[WritableBuffer]:
+    """Memory-maps the file for reading and writing, an empty file is given as an empty bytearray"""
+    with pathlib.Path(path).open("r+b") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield bytearray()
+            return
+        with mmap.mmap(f.fileno(), 0) as mapped:
+            yield mapped
@@ -0,0 +1,59 @@
+import itertools
+import random
+import string
+import unittest
+
+import homework01.batch as batch
+import homework01.caesar as caesar
+import homework01.rsa as rsa
+import homework01.vigenere as vigenere
+
+
+def random_text(length):
+    return "".join(random.choice(string.ascii_letters + " -,") for _ in range(length))
+
+
+class BatchTestCase(unittest.TestCase):
+    def test_caesar(self):
+        records = [(random_text(random.randint(0, 32)), random.randint(0, 25)) for _ in range(500)]
+        stats = batch.BatchStats()
+        ciphertexts = list(batch.encrypt_batch(records, "caesar", chunk_size=64, max_workers=2, stats=stats))
+        self.assertEqual([caesar.encrypt_caesar(text, shift) for text, shift in records], ciphertexts)
+        self.assertEqual(500, stats.records)
+        self.assertEqual(8, stats.chunks)
+        self.assertGreater(stats.records_per_second, 0)
+
+        plaintexts = batch.decrypt_batch(zip(ciphertexts, (shift for _, shift in records)), "caesar", max_workers=2)
+        self.assertEqual([text for text, _ in records], list(plaintexts))
+
+    def test_vigenere(self):
+        keywords = ["".join(random.choice(string.ascii_letters) for _ in range(random.randint(1, 8))) for _ in range(300)]
+        records = [(random_text(random.randint(0, 32)), keyword) for keyword in keywords]
+        ciphertexts = list(batch.encrypt_batch(records, "vigenere", chunk_size=16, max_workers=2))
+        self.assertEqual([vigenere.encrypt_vigenere(text, key) for text, key in records], ciphertexts)
+
+    def test_endless_input(self):
+        records = ((str(i), 1) for i in itertools.count())
+        results = batch.encrypt_batch(records, chunk_size=10, max_workers=2, max_pending=2)
+        self.assertEqual([str(i) for i in range(100)], list(itertools.islice(results, 100)))
+
+    def test_unknown_cipher(self):
+        with self.assertRaises(ValueError):
+            batch.encrypt_batch([], "enigma")
+
+    def test_decrypt_rsa(self):
+        p, q = rsa.generate_prime(128), rsa.generate_prime(128)
+        public, private = rsa.generate_keypair(p, q)
+        messages = [random_text(random.randint(0, 40)).encode("ascii") for _ in range(200)]
+        ciphertexts = [rsa.encrypt_blocks(public, message) for message in messages]
+        for key, e in [(private, None), (rsa.crt_key(private, p, q), None), (private, public[0])]:
+            with self.subTest(key=type(key).__name__, e=e):
+                stats = batch.BatchStats()
+                plaintexts = batch.decrypt_rsa_batch(
+                    key, iter(ciphertexts), chunk_size=16, max_workers=2, stats=stats, e=e
+                )
+                self.assertEqual(messages, list(plaintexts))
+                self.assertEqual(200, stats.records)
+                self.assertEqual(13, stats.chunks)
+                self.assertGreater(stats.latency_mean, 0)
+                self.assertGreaterEqual(stats.latency_max, stats.latency_mean)
@@ -0,0 +1,90 @@
+import contextlib
+import io
+import json
+import pathlib
+import tempfile
+import unittest
+
+import homework01.benchmark as benchmark
+
+
+class BenchmarkTestCase(unittest.TestCase):
+    def test_run_benchmarks(self):
+        results = benchmark.run_benchmarks(sizes=[100], key_lengths=[3], rsa_key_bits=[12], rsa_sizes=[10], repeat=1, prime_bits=[64], inverse_counts=[10])
+        names = [result["name"] for result in results]
+        self.assertEqual(
+            [
+                "caesar.encrypt",
+                "caesar.decrypt",
+                "vigenere.encrypt",
+                "vigenere.decrypt",
+                "rsa.encrypt",
+                "rsa.decrypt",
+                "rsa.decrypt_crt",
+                "rsa.generate_prime",
+                "rsa.multiplicative_inverse",
+                "rsa.binary_extended_gcd",
+                "rsa.batch_inverse",
+                "rsa.gcd",
+                "rsa.binary_gcd",
+            ],
+            names,
+        )
+        self.assertEqual({"key_length": 3}, results[2]["params"])
+        self.assertTrue(all(result[f"{result['unit']}_per_second"] > 0 for result in results))
+        units = {result["name"]: result["unit"] for result in results}
+        self.assertEqual("bytes", units["caesar.encrypt"])
+        self.assertEqual("ops", units["rsa.generate_prime"])
+        self.assertEqual("ops", units["rsa.batch_inverse"])
+        self.assertNotIn("bytes_per_second", [r for r in results if r["name"] == "rsa.gcd"][0])
+        json.dumps(results)
+
+    def test_envelope_results(self):
+        results = benchmark.run_benchmarks(
+            sizes=[10000], key_lengths=[], rsa_key_bits=[64, 256], rsa_sizes=[1000], repeat=1, prime_bits=[], inverse_counts=[]
+        )
+        envelope_results = [(r["params"]["key_bits"], r["size"]) for r in results if r["name"] == "envelope.seal"]
+        self.assertEqual([(256, 1000), (256, 10000)], envelope_results)
+        self.assertIn("rsa.encrypt_blocks", {result["name"] for result in results})
+
+    def test_compare(self):
+        baseline = [
+            {"name": "a", "params": {}, "size": 1, "bytes_per_second": 100.0},
+            {"name": "b", "params": {"k": 1}, "size": 1, "bytes_per_second": 100.0},
+        ]
+        results = [
+            {"name": "a", "params": {}, "size": 1, "bytes_per_second": 95.0},
+            {"name": "b", "params": {"k": 1}, "size": 1, "bytes_per_second": 50.0},
+            {"name": "c", "params": {}, "size": 1, "bytes_per_second": 1.0},
+        ]
+        regressions = benchmark.compare(results, baseline, threshold=0.1)
+        self.assertEqual(["b"], [regression["name"] for regression in regressions])
+        self.assertAlmostEqual(-0.5, regressions[0]["change"])
+        self.assertEqual(100.0, regressions[0]["baseline_bytes_per_second"])
+
+    def test_compare_units(self):
+        baseline = [{"name": "p", "params": {}, "size": 1, "unit": "ops", "ops_per_second": 100.0}]
+        results = [{"name": "p", "params": {}, "size": 1, "unit": "ops", "ops_per_second": 10.0}]
+        regressions = benchmark.compare(results, baseline)
+        self.assertEqual([-0.9], [round(regression["change"], 6) for regression in regressions])
+        self.assertEqual(100.0, regressions[0]["baseline_ops_per_second"])
+        old_baseline = [{"name": "p", "params": {}, "size": 1, "bytes_per_second": 100.0}]
+        self.assertEqual([], benchmark.compare(results, old_baseline))
+
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            output = pathlib.Path(tmp) / "results.json"
+            argv = ["--sizes", "1k", "--key-lengths", "2", "--rsa-bits", "12", "--rsa-sizes", "8", "--repeat", "1"]
+            argv += ["--prime-bits", "32", "--inverse-counts", "10"]
+            self.assertEqual(0, benchmark.main(argv + ["--output", str(output)]))
+            results = json.loads(output.read_text())
+            inverse = [result for result in results if result["name"] == "rsa.batch_inverse"]
+            self.assertEqual([10], [result["size"] for result in inverse])
+            for result in results:
+                result[f"{result['unit']}_per_second"] *= 1000
+            baseline = pathlib.Path(tmp) / "baseline.json"
+            baseline.write_text(json.dumps(results))
+            stderr = io.StringIO()
+            with contextlib.redirect_stderr(stderr):
+                self.assertEqual(1, benchmark.main(argv + ["--output", str(output), "--baseline", str(baseline)]))
+            self.assertIn("REGRESSION caesar.encrypt", stderr.getvalue())
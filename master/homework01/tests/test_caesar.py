@@ -1,5 +1,7 @@
+import pathlib
 import random
 import string
+import tempfile
 import unittest
 
 import homework01.caesar as caesar
@@ -42,6 +44,12 @@ class CaesarTestCase(unittest.TestCase):
             with self.subTest(case=i, chiphertext=chiphertext, plaintext=plaintext):
                 self.assertEqual(plaintext, caesar.decrypt_caesar(chiphertext, shift=shift))
 
+    def test_shift_wraps_around(self):
+        self.assertEqual("Bcd-Ab", caesar.encrypt_caesar("Abc-Za", shift=27))
+        self.assertEqual("Zab-Yz", caesar.encrypt_caesar("Abc-Za", shift=-1))
+        self.assertEqual("Abc-Za", caesar.decrypt_caesar("Bcd-Ab", shift=27))
+        self.assertEqual("Привет, Bcd", caesar.encrypt_caesar("Привет, Abc", shift=1))
+
     def test_randomized(self):
         shift = random.randint(8, 24)
         plaintext = "".join(random.choice(string.ascii_letters + " -,") for _ in range(64))
@@ -51,3 +59,47 @@ class CaesarTestCase(unittest.TestCase):
             caesar.decrypt_caesar(ciphertext, shift=shift),
             msg=f"shift={shift}, ciphertext={ciphertext}",
         )
+
+    def test_stream(self):
+        plaintext = "".join(random.choice(string.ascii_letters + " -,\n") for _ in range(1000))
+        chunks = [plaintext[i : i + 37] for i in range(0, len(plaintext), 37)]
+        encrypted = list(caesar.encrypt_caesar_stream(chunks, shift=5))
+        self.assertEqual(caesar.encrypt_caesar(plaintext, shift=5), "".join(encrypted))
+        self.assertEqual(plaintext, "".join(caesar.decrypt_caesar_stream(encrypted, shift=5)))
+
+    def test_file(self):
+        plaintext = "".join(random.choice(string.ascii_letters + " -,\n") for _ in range(1000))
+        with tempfile.TemporaryDirectory() as tmp:
+            src, enc, dec = (pathlib.Path(tmp) / name for name in ("src.txt", "enc.txt", "dec.txt"))
+            src.write_text(plaintext)
+            caesar.encrypt_caesar_file(src, enc, shift=7, chunk_size=64)
+            self.assertEqual(caesar.encrypt_caesar(plaintext, shift=7), enc.read_text())
+            caesar.decrypt_caesar_file(enc, dec, shift=7, chunk_size=64)
+            self.assertEqual(plaintext, dec.read_text())
+
+    def test_bytes(self):
+        shift = random.randint(1, 25)
+        plaintext = "".join(random.choice(string.printable) for _ in range(1000))
+        expected = caesar.encrypt_caesar(plaintext, shift=shift).encode("ascii")
+        self.assertEqual(expected, caesar.encrypt_caesar_bytes(plaintext.encode("ascii"), shift=shift))
+        self.assertEqual(plaintext.encode("ascii"), caesar.decrypt_caesar_bytes(memoryview(expected), shift=shift))
+
+        buffer = bytearray(plaintext.encode("ascii"))
+        caesar.encrypt_caesar_inplace(memoryview(buffer)[10:], shift=shift, chunk_size=64)
+        self.assertEqual(plaintext[:10].encode("ascii") + expected[10:], buffer)
+
+    def test_mmap(self):
+        shift = random.randint(1, 25)
+        plaintext = "".join(random.choice(string.ascii_letters + " -,\n") for _ in range(1000))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = pathlib.Path(tmp) / "data.txt"
+            path.write_bytes(plaintext.encode("ascii"))
+            caesar.encrypt_caesar_mmap(path, shift=shift, chunk_size=100)
+            self.assertEqual(caesar.encrypt_caesar(plaintext, shift=shift).encode("ascii"), path.read_bytes())
+            caesar.decrypt_caesar_mmap(path, shift=shift)
+            self.assertEqual(plaintext.encode("ascii"), path.read_bytes())
+
+            empty = pathlib.Path(tmp) / "empty.txt"
+            empty.write_bytes(b"")
+            caesar.encrypt_caesar_mmap(empty, shift=shift)
+            self.assertEqual(b"", empty.read_bytes())
@@ -0,0 +1,86 @@
+import os
+import pathlib
+import tempfile
+import unittest
+
+import homework01.container as container
+import homework01.rsa as rsa
+
+
+class ContainerTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.p, cls.q = rsa.generate_prime(256), rsa.generate_prime(256)
+        cls.public, cls.private = rsa.generate_keypair(cls.p, cls.q)
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = pathlib.Path(tmp.name)
+
+    def test_pack_ints(self):
+        ciphertext = rsa.encrypt(self.public, "secret message")
+        width = rsa.block_size(self.public)
+        packed = container.pack_ints(ciphertext, width)
+        self.assertEqual(len(ciphertext) * width, len(packed))
+        self.assertEqual(ciphertext, container.unpack_ints(packed, width))
+        with self.assertRaises(ValueError):
+            container.unpack_ints(packed[:-1], width)
+
+    def test_keys(self):
+        crt = rsa.crt_key(self.private, self.p, self.q)
+        for key in [self.public, self.private, crt]:
+            with self.subTest(key=type(key).__name__):
+                path = self.dir / "key.bin"
+                container.save_key(key, path)
+                self.assertEqual(key, container.read_key(path))
+                self.assertEqual(type(key), type(container.read_key(path)))
+        with self.assertRaises(ValueError):
+            container.load_key(container.dump_key((1, 2, 3)))
+        with self.assertRaises(ValueError):
+            container.load_key(container.dump_key(self.public)[:-1])
+
+    def test_encrypt_decrypt_file(self):
+        src, enc, dec = self.dir / "plain", self.dir / "enc", self.dir / "dec"
+        for size in [0, 1, 1000, 20000]:
+            with self.subTest(size=size):
+                plaintext = os.urandom(size)
+                src.write_bytes(plaintext)
+                container.encrypt_file(self.public, src, enc, chunk_size=3000)
+                records = list(container.read_records(enc))
+                chunk_size = 3000 // rsa.block_capacity(self.public) * rsa.block_capacity(self.public)
+                self.assertEqual(-(-size // chunk_size), len(records))
+                self.assertTrue(all(kind == container.BLOCKS for kind, _ in records))
+                container.decrypt_file(self.private, enc, dec)
+                self.assertEqual(plaintext, dec.read_bytes())
+                container.decrypt_file(self.private, enc, dec, e=self.public[0])
+                self.assertEqual(plaintext, dec.read_bytes())
+
+    def test_small_modulus(self):
+        src, enc = self.dir / "plain", self.dir / "enc"
+        src.write_bytes(b"data")
+        with self.assertRaises(ValueError):
+            container.encrypt_file((5, 2**80 + 1), src, enc)
+
+    def test_mixed_records(self):
+        path = self.dir / "archive"
+        with path.open("wb") as f:
+            writer = container.ContainerWriter(f)
+            writer.write_key(self.public)
+            writer.write_blocks(self.public, b"first")
+            writer.write_blocks(self.public, b"second")
+        self.assertEqual(self.public, container.read_key(path))
+        decrypted = [rsa.decrypt_blocks(self.private, p) for k, p in container.read_records(path) if k == container.BLOCKS]
+        self.assertEqual([b"first", b"second"], decrypted)
+
+    def test_corrupt(self):
+        path = self.dir / "archive"
+        path.write_bytes(b"")
+        with self.assertRaises(ValueError):
+            list(container.read_records(path))
+        path.write_bytes(container.MAGIC + bytes([container.BLOCKS]) + (100).to_bytes(4, "big") + b"short")
+        with self.assertRaises(ValueError):
+            list(container.read_records(path))
+        path.write_bytes(container.MAGIC)
+        with self.assertRaises(ValueError):
+            container.read_key(path)
@@ -0,0 +1,69 @@
+import pathlib
+import random
+import string
+import tempfile
+import unittest
+
+import homework01.caesar as caesar
+import homework01.cryptanalysis as cryptanalysis
+import homework01.vigenere as vigenere
+
+TEXT = (
+    "It was the best of times, it was the worst of times, it was the age of wisdom, "
+    "it was the age of foolishness, it was the epoch of belief, it was the epoch of incredulity, "
+    "it was the season of Light, it was the season of Darkness, it was the spring of hope, "
+    "it was the winter of despair, we had everything before us, we had nothing before us."
+)
+
+
+class CryptanalysisTestCase(unittest.TestCase):
+    def test_letter_histogram(self):
+        histogram = cryptanalysis.letter_histogram("Hello, World!")
+        self.assertEqual(26, len(histogram))
+        self.assertEqual(10, sum(histogram))
+        self.assertEqual(3, histogram[ord("l") - ord("a")])
+        self.assertEqual(2, histogram[ord("o") - ord("a")])
+
+    def test_crack_caesar(self):
+        for shift in range(26):
+            with self.subTest(shift=shift):
+                ciphertext = caesar.encrypt_caesar(TEXT, shift=shift)
+                self.assertEqual(shift, cryptanalysis.crack_caesar(ciphertext))
+
+    def test_crack_caesar_sample(self):
+        shift = random.randint(1, 25)
+        ciphertext = caesar.encrypt_caesar(TEXT * 1000, shift=shift)
+        self.assertEqual(shift, cryptanalysis.crack_caesar(ciphertext, sample_size=1024))
+        chunks = [ciphertext[i : i + 100] for i in range(0, len(ciphertext), 100)]
+        self.assertEqual(shift, cryptanalysis.crack_caesar_stream(chunks, sample_size=1024))
+
+    def test_crack_caesar_file(self):
+        shift = random.randint(1, 25)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = pathlib.Path(tmp) / "cipher.txt"
+            path.write_text(caesar.encrypt_caesar(TEXT * 100, shift=shift))
+            self.assertEqual(shift, cryptanalysis.crack_caesar_file(path, sample_size=2048))
+            self.assertEqual(shift, cryptanalysis.crack_caesar_file(path, sample_size=None))
+
+    def test_index_of_coincidence(self):
+        self.assertEqual(0.0, cryptanalysis.index_of_coincidence([1] * 26))
+        self.assertEqual(1.0, cryptanalysis.index_of_coincidence([5] + [0] * 25))
+        histogram = cryptanalysis.letter_histogram(TEXT)
+        self.assertGreater(cryptanalysis.index_of_coincidence(histogram), 0.06)
+
+    def test_estimate_key_lengths(self):
+        plaintext = " ".join(random.choice(TEXT.split()) for _ in range(1000))
+        ciphertext = vigenere.encrypt_vigenere(plaintext, "LEMON")
+        lengths = cryptanalysis.estimate_key_lengths(ciphertext)
+        self.assertEqual(5, lengths[0])
+        self.assertTrue(all(length % 5 == 0 for length in lengths))
+
+    def test_crack_vigenere(self):
+        cases = ["A", "KEY", "LEMON", "LSCI", "CRYPTOGRAPHY"]
+        cases.append("".join(random.choice(string.ascii_uppercase) for _ in range(random.randint(4, 24))))
+        for keyword in cases:
+            with self.subTest(keyword=keyword):
+                plaintext = " ".join(random.choice(TEXT.split()) for _ in range(2000))
+                ciphertext = vigenere.encrypt_vigenere(plaintext, keyword)
+                key = cryptanalysis.crack_vigenere(ciphertext)
+                self.assertEqual(plaintext, vigenere.decrypt_vigenere(ciphertext, key))
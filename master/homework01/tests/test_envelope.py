@@ -0,0 +1,49 @@
+import os
+import pathlib
+import tempfile
+import unittest
+
+import homework01.envelope as envelope
+import homework01.rsa as rsa
+
+
+class EnvelopeTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.p, cls.q = rsa.generate_prime(256), rsa.generate_prime(256)
+        cls.public, cls.private = rsa.generate_keypair(cls.p, cls.q)
+
+    def test_seal_unseal(self):
+        for size in [0, 1, 1000, 10000]:
+            with self.subTest(size=size):
+                plaintext = os.urandom(size)
+                sealed = envelope.seal(self.public, plaintext, session_key_size=64)
+                header_size = 4 + 2 * rsa.block_size(self.public)
+                self.assertEqual(header_size + size, len(sealed))
+                self.assertNotEqual(plaintext[:64], sealed[header_size : header_size + 64] if size else b"-")
+                self.assertEqual(plaintext, envelope.unseal(self.private, sealed))
+
+    def test_stream(self):
+        plaintext = os.urandom(5000)
+        chunks = [plaintext[i : i + 333] for i in range(0, len(plaintext), 333)]
+        sealed = b"".join(envelope.seal_stream(self.public, chunks, session_key_size=100))
+        sealed_chunks = [sealed[i : i + 7] for i in range(0, len(sealed), 7)]
+        private = rsa.crt_key(self.private, self.p, self.q)
+        self.assertEqual(plaintext, b"".join(envelope.unseal_stream(private, sealed_chunks)))
+        self.assertEqual(plaintext, b"".join(envelope.unseal_stream(private, sealed_chunks, e=self.public[0])))
+
+    def test_truncated(self):
+        sealed = envelope.seal(self.public, b"message")
+        with self.assertRaises(ValueError):
+            envelope.unseal(self.private, sealed[:100])
+        with self.assertRaises(ValueError):
+            envelope.unseal(self.private, b"")
+
+    def test_file(self):
+        plaintext = os.urandom(100000)
+        with tempfile.TemporaryDirectory() as tmp:
+            src, sealed, dst = (pathlib.Path(tmp) / name for name in ("src.bin", "sealed.bin", "dst.bin"))
+            src.write_bytes(plaintext)
+            envelope.seal_file(self.public, src, sealed, chunk_size=4096)
+            envelope.unseal_file(self.private, sealed, dst, chunk_size=1000)
+            self.assertEqual(plaintext, dst.read_bytes())
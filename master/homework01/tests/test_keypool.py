@@ -0,0 +1,66 @@
+import time
+import unittest
+from unittest import mock
+
+import homework01.rsa as rsa
+from homework01.keypool import KeypairPool
+
+
+class KeypairPoolTestCase(unittest.TestCase):
+    def wait_full(self, pool, timeout=30):
+        deadline = time.monotonic() + timeout
+        while len(pool) < pool.size and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(pool.size, len(pool))
+
+    def check_keypair(self, keypair, bits):
+        public, private = keypair
+        self.assertEqual(rsa.PUBLIC_EXPONENT, public[0])
+        self.assertEqual(bits, public[1].bit_length())
+        self.assertEqual(b"message", rsa.decrypt_blocks(private, rsa.encrypt_blocks(public, b"message")))
+
+    def test_threads(self):
+        with KeypairPool(bits=256, size=4, refill_at=1, workers=2, processes=False) as pool:
+            self.wait_full(pool)
+            keypairs = [pool.get(timeout=30) for _ in range(3)]
+            for keypair in keypairs:
+                self.check_keypair(keypair, 256)
+            self.assertEqual(3, len({public for public, _ in keypairs}))
+            self.wait_full(pool)
+
+    def test_processes(self):
+        with KeypairPool(bits=256, size=2, refill_at=0, workers=2) as pool:
+            self.check_keypair(pool.get(timeout=30), 256)
+            self.check_keypair(pool.get(timeout=30), 256)
+
+    def test_closed(self):
+        pool = KeypairPool(bits=128, size=2, refill_at=0, processes=False)
+        pool.close()
+        with self.assertRaises(RuntimeError):
+            pool.get(timeout=1)
+
+    def test_invalid_watermark(self):
+        with self.assertRaises(ValueError):
+            KeypairPool(size=2, refill_at=2)
+
+    def test_invalid_bits(self):
+        with self.assertRaises(ValueError):
+            KeypairPool(bits=3, processes=False)
+        with self.assertRaises(ValueError):
+            KeypairPool(bits=128, e=2**127 + 1, processes=False)
+
+    def test_generation_error(self):
+        error = RuntimeError("no entropy")
+        with mock.patch.object(rsa, "generate_rsa_keypair", side_effect=error):
+            with KeypairPool(bits=256, size=2, refill_at=0, processes=False) as pool:
+                with self.assertRaises(RuntimeError) as cm:
+                    pool.get()
+                self.assertIs(error, cm.exception)
+                with self.assertRaises(RuntimeError):
+                    pool.get(timeout=1)
+                self.assertFalse(pool._thread.is_alive())
+
+    def test_fixed_exponent(self):
+        self.assertEqual(((5, 323), (173, 323)), rsa.generate_keypair(17, 19, e=5))
+        with self.assertRaises(ValueError):
+            rsa.generate_keypair(17, 19, e=3)
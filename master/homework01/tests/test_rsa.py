@@ -1,5 +1,6 @@
 import random
 import unittest
+from unittest import mock
 
 import homework01.rsa as rsa
 
@@ -17,6 +18,20 @@ class RSATestCase(unittest.TestCase):
         self.assertTrue(rsa.is_prime(7))
         self.assertFalse(rsa.is_prime(8))
         self.assertTrue(rsa.is_prime(3571))
+        self.assertFalse(rsa.is_prime(3215031751))
+        self.assertFalse(rsa.is_prime(3825123056546413051))
+        self.assertTrue(rsa.is_prime(2**61 - 1))
+        self.assertTrue(rsa.is_prime(2**127 - 1))
+        self.assertFalse(rsa.is_prime((2**89 - 1) * (2**107 - 1)))
+
+    def test_generate_prime(self):
+        for bits in [2, 3, 8, 16, 64, 256]:
+            with self.subTest(bits=bits):
+                p = rsa.generate_prime(bits)
+                self.assertEqual(bits, p.bit_length())
+                self.assertTrue(rsa.is_prime(p))
+        with self.assertRaises(ValueError):
+            rsa.generate_prime(1)
 
     def test_gcd(self):
         self.assertEqual(0, rsa.gcd(0, 0))
@@ -42,3 +57,82 @@ class RSATestCase(unittest.TestCase):
         self.assertEqual(((121, 323), (169, 323)), rsa.generate_keypair(17, 19))
         self.assertEqual(((142169, 1697249), (734969, 1697249)), rsa.generate_keypair(1229, 1381))
         self.assertEqual(((9678731, 11188147), (1804547, 11188147)), rsa.generate_keypair(3259, 3433))
+
+    def test_generate_rsa_keypair(self):
+        with mock.patch.object(rsa, "is_prime", wraps=rsa.is_prime) as is_prime:
+            public, private = rsa.generate_rsa_keypair(1024)
+        self.assertEqual(1024, public[1].bit_length())
+        self.assertEqual(65537, public[0])
+        self.assertTrue(all(args[1] == rsa._generation_rounds(512) for args, _ in is_prime.call_args_list))
+        self.assertEqual(private.n, private.p * private.q)
+        self.assertEqual(b"message", rsa.decrypt_blocks(private, rsa.encrypt_blocks(public, b"message")))
+
+    def test_encrypt_decrypt(self):
+        p, q = 1229, 1381
+        public, private = rsa.generate_keypair(p, q)
+        message = "Hello, RSA! Привет"
+        ciphertext = rsa.encrypt(public, message)
+        self.assertEqual(len(message), len(ciphertext))
+        self.assertEqual(message, rsa.decrypt(private, ciphertext))
+        self.assertEqual(message, rsa.decrypt(rsa.crt_key(private, p, q), ciphertext))
+
+    def test_crt_key(self):
+        private = (169, 323)
+        key = rsa.crt_key(private, 17, 19)
+        self.assertEqual((169, 323, 17, 19, 9, 7, 9), tuple(key))
+        for value in range(323):
+            self.assertEqual(rsa.power(private, value), rsa.power(key, value))
+        with self.assertRaises(ValueError):
+            rsa.crt_key(private, 17, 23)
+
+    def test_blocks(self):
+        p, q = rsa.generate_prime(256), rsa.generate_prime(256)
+        public, private = rsa.generate_keypair(p, q)
+        self.assertEqual(64, rsa.block_size(public))
+        self.assertEqual(53, rsa.block_capacity(public))
+        for message in [b"", b"x", bytes(range(256)) * 3]:
+            with self.subTest(length=len(message)):
+                ciphertext = rsa.encrypt_blocks(public, message)
+                blocks = -(-len(message) // rsa.block_capacity(public))
+                self.assertEqual(blocks * rsa.block_size(public), len(ciphertext))
+                self.assertEqual(message, rsa.decrypt_blocks(private, ciphertext))
+                self.assertEqual(message, rsa.decrypt_blocks(rsa.crt_key(private, p, q), ciphertext))
+
+        with self.assertRaises(ValueError):
+            rsa.decrypt_blocks(private, b"\x00" * 63)
+        with self.assertRaises(ValueError):
+            rsa.encrypt_blocks((121, 323), b"message")
+
+    def test_binary_gcd(self):
+        self.assertEqual(0, rsa.binary_gcd(0, 0))
+        self.assertEqual(1, rsa.binary_gcd(3, 7))
+        self.assertEqual(9, rsa.binary_gcd(0, 9))
+        self.assertEqual(12, rsa.binary_gcd(12, 0))
+        self.assertEqual(18, rsa.binary_gcd(461952, 116298))
+        self.assertEqual(32, rsa.binary_gcd(7966496, 314080416))
+        self.assertEqual(526, rsa.binary_gcd(24826148, 45296490))
+        for _ in range(100):
+            a, b = random.getrandbits(256), random.getrandbits(256)
+            self.assertEqual(rsa.gcd(a, b), rsa.binary_gcd(a, b))
+
+    def test_binary_extended_gcd(self):
+        for a, b in [(7, 40), (42, 2017), (461952, 116298), (1, 1), (64, 48)]:
+            g, x, y = rsa.binary_extended_gcd(a, b)
+            self.assertEqual(rsa.gcd(a, b), g)
+            self.assertEqual(g, a * x + b * y)
+        with self.assertRaises(ValueError):
+            rsa.binary_extended_gcd(0, 5)
+
+    def test_batch_inverse(self):
+        n = 11181456
+        values = [v for v in range(2, 500) if rsa.gcd(v, n) == 1]
+        self.assertEqual([rsa.multiplicative_inverse(v, n) for v in values], rsa.batch_inverse(values, n))
+        self.assertEqual([], rsa.batch_inverse([], n))
+        with self.assertRaises(ValueError):
+            rsa.batch_inverse([5, 6], 40)
+
+    def test_blinded_decrypt_blocks(self):
+        public, private = rsa.generate_rsa_keypair(256)
+        message = bytes(range(256))
+        ciphertext = rsa.encrypt_blocks(public, message)
+        self.assertEqual(message, rsa.decrypt_blocks(private, ciphertext, e=public[0]))
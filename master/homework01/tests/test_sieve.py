@@ -0,0 +1,48 @@
+import pathlib
+import tempfile
+import unittest
+
+import homework01.rsa as rsa
+from homework01.sieve import PrimeSieve
+
+
+class PrimeSieveTestCase(unittest.TestCase):
+    def test_is_prime(self):
+        sieve = PrimeSieve(100000, segment_size=1000)
+        self.assertEqual(0, sieve.limit)
+        for n in range(-5, 100000):
+            self.assertEqual(rsa.is_prime(n), sieve.is_prime(n), msg=f"n={n}")
+        self.assertEqual(100000, sieve.limit)
+        with self.assertRaises(ValueError):
+            sieve.is_prime(100001)
+
+    def test_lazy_extension(self):
+        sieve = PrimeSieve(10**6, segment_size=1024)
+        self.assertTrue(sieve.is_prime(1021))
+        self.assertEqual(1024, sieve.limit)
+        self.assertIn(4099, sieve)
+        self.assertEqual(5120, sieve.limit)
+
+    def test_save_load(self):
+        sieve = PrimeSieve(50000, segment_size=4096)
+        sieve.extend(20000)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = pathlib.Path(tmp) / "primes.bin"
+            sieve.save(path)
+            loaded = PrimeSieve.load(path, max_limit=50000)
+            self.assertEqual(sieve.limit, loaded.limit)
+            self.assertEqual([n for n in range(20000) if sieve.is_prime(n)], [n for n in range(20000) if n in loaded])
+            self.assertTrue(loaded.is_prime(49999))
+            self.assertEqual(50000, loaded.limit)
+            loaded.close()
+
+    def test_rsa_integration(self):
+        sieve = PrimeSieve(10**5)
+        rsa.use_prime_sieve(sieve)
+        try:
+            self.assertTrue(rsa.is_prime(99991))
+            self.assertFalse(rsa.is_prime(99993))
+            self.assertTrue(rsa.is_prime(2**61 - 1))
+            self.assertGreater(sieve.limit, 0)
+        finally:
+            rsa.use_prime_sieve(None)
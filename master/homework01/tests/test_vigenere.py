@@ -1,5 +1,7 @@
+import pathlib
 import random
 import string
+import tempfile
 import unittest
 
 import homework01.vigenere as vigenere
@@ -36,3 +38,67 @@ class VigenereTestCase(unittest.TestCase):
         plaintext = "".join(random.choice(string.ascii_letters + " -,") for _ in range(64))
         ciphertext = vigenere.encrypt_vigenere(plaintext, keyword)
         self.assertEqual(plaintext, vigenere.decrypt_vigenere(ciphertext, keyword))
+
+    def test_stream(self):
+        keyword = "lsci"
+        plaintext = "".join(random.choice(string.ascii_letters + " -,\n") for _ in range(1000))
+        chunks = [plaintext[i : i + 37] for i in range(0, len(plaintext), 37)]
+        encrypted = list(vigenere.encrypt_vigenere_stream(chunks, keyword))
+        self.assertEqual(vigenere.encrypt_vigenere(plaintext, keyword), "".join(encrypted))
+        self.assertEqual(plaintext, "".join(vigenere.decrypt_vigenere_stream(encrypted, keyword)))
+
+    def test_file(self):
+        keyword = "LEMON"
+        plaintext = "".join(random.choice(string.ascii_letters + " -,\n") for _ in range(1000))
+        with tempfile.TemporaryDirectory() as tmp:
+            src, enc, dec = (pathlib.Path(tmp) / name for name in ("src.txt", "enc.txt", "dec.txt"))
+            src.write_text(plaintext)
+            vigenere.encrypt_vigenere_file(src, enc, keyword, chunk_size=64)
+            self.assertEqual(vigenere.encrypt_vigenere(plaintext, keyword), enc.read_text())
+            vigenere.decrypt_vigenere_file(enc, dec, keyword, chunk_size=64)
+            self.assertEqual(plaintext, dec.read_text())
+
+    def test_bytes(self):
+        keyword = "".join(random.choice(string.ascii_letters) for _ in range(random.randint(1, 24)))
+        plaintext = "".join(random.choice(string.printable) for _ in range(1000))
+        expected = vigenere._shift_vigenere(plaintext + "—", keyword, 1)[:-1].encode("ascii")
+        ciphertext = vigenere.encrypt_vigenere_bytes(plaintext.encode("ascii"), keyword)
+        self.assertEqual(expected, ciphertext)
+        self.assertEqual(plaintext.encode("ascii"), vigenere.decrypt_vigenere_bytes(bytearray(ciphertext), keyword))
+
+    def test_non_ascii(self):
+        ascii_ciphertext = vigenere.encrypt_vigenere("ATTACK - AT DAWN", "LEMON")
+        self.assertEqual(ascii_ciphertext.replace("-", "—"), vigenere.encrypt_vigenere("ATTACK — AT DAWN", "LEMON"))
+
+    def test_empty(self):
+        for text in ["", "123", "ATTACK — AT DAWN"]:
+            with self.subTest(text=text):
+                self.assertEqual(text, vigenere.encrypt_vigenere(text, ""))
+                self.assertEqual(text, vigenere.decrypt_vigenere(text, ""))
+                self.assertEqual(["AT", text], list(vigenere.encrypt_vigenere_stream(["AT", text], "")))
+        self.assertEqual("", vigenere.encrypt_vigenere("", "LEMON"))
+        self.assertEqual(b"ATTACK", vigenere.encrypt_vigenere_bytes(b"ATTACK", ""))
+        buffer = bytearray(b"ATTACK")
+        vigenere.encrypt_vigenere_inplace(buffer, "", chunk_size=4)
+        self.assertEqual(b"ATTACK", buffer)
+
+    def test_inplace(self):
+        keyword = "LEMON"
+        plaintext = "".join(random.choice(string.printable) for _ in range(1000)).encode("ascii")
+        expected = vigenere.encrypt_vigenere_bytes(plaintext, keyword)
+        buffer = bytearray(plaintext)
+        vigenere.encrypt_vigenere_inplace(buffer, keyword, chunk_size=37)
+        self.assertEqual(expected, buffer)
+        vigenere.decrypt_vigenere_inplace(memoryview(buffer), keyword, chunk_size=64)
+        self.assertEqual(plaintext, buffer)
+
+    def test_mmap(self):
+        keyword = "".join(random.choice(string.ascii_letters) for _ in range(random.randint(4, 24)))
+        plaintext = "".join(random.choice(string.ascii_letters + " -,\n") for _ in range(1000))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = pathlib.Path(tmp) / "data.txt"
+            path.write_bytes(plaintext.encode("ascii"))
+            vigenere.encrypt_vigenere_mmap(path, keyword, chunk_size=100)
+            self.assertEqual(vigenere.encrypt_vigenere(plaintext, keyword).encode("ascii"), path.read_bytes())
+            vigenere.decrypt_vigenere_mmap(path, keyword)
+            self.assertEqual(plaintext.encode("ascii"), path.read_bytes())
@@ -1,30 +1,84 @@
-def encrypt_vigenere(plaintext: str, keyword: str) -> str:
+import pathlib
+import typing as tp
+
+from homework01.streams import (
+    CHUNK_SIZE,
+    ReadableBuffer,
+    WritableBuffer,
+    map_file,
+    read_chunks,
+)
+
+_UPPER = bytes(range(ord("A"), ord("Z") + 1))
+_LOWER = bytes(range(ord("a"), ord("z") + 1))
+_BYTE_TABLES = [bytes.maketrans(_UPPER + _LOWER, _UPPER[s:] + _UPPER[:s] + _LOWER[s:] + _LOWER[:s]) for s in range(26)]
+
+
+def _key_shifts(keyword: str, direction: int) -> tp.List[int]:
+    return [direction * (ord(k) - ord("A")) % 26 for k in keyword.upper()]
+
+
+def _shift_vigenere_bytes(data: ReadableBuffer, keyword: str, direction: int, offset: int = 0) -> bytes:
     """
-    Encrypts plaintext using a Vigenere cipher.
-    >>> encrypt_vigenere("PYTHON", "A")
-    'PYTHON'
-    >>> encrypt_vigenere("python", "a")
-    'python'
-    >>> encrypt_vigenere("ATTACKATDAWN", "LEMON")
-    'LXFOPVEFRNHR'
+    Shifts every ASCII letter of data by the keyword letter standing at its position.
+    All bytes of one key column data[j::len(keyword)] share the shift, so every
+    column is handled by a single bytes.translate call.
+    An empty keyword leaves data unchanged.
+    """
+    if not keyword:
+        return bytes(data)
+    shifts = _key_shifts(keyword, direction)
+    key_length = len(shifts)
+    offset %= key_length
+    shifts = shifts[offset:] + shifts[:offset]
+
+    result = bytearray(data)
+    for j, shift in enumerate(shifts):
+        result[j::key_length] = result[j::key_length].translate(_BYTE_TABLES[shift])
+    return bytes(result)
+
+
+def _shift_vigenere(text: str, keyword: str, direction: int, offset: int = 0) -> str:
+    """
+    Shifts every letter of text by the keyword letter standing at its position.
+    offset is the position of the first character of text in the whole message.
+    An empty keyword leaves text unchanged.
     """
-    ciphertext = ""
+    if not keyword:
+        return text
+    if text.isascii():
+        return _shift_vigenere_bytes(text.encode("ascii"), keyword, direction, offset).decode("ascii")
+
     keyword = keyword.upper()
     key_length = len(keyword)
+    shifts = [direction * (ord(k) - ord("A")) for k in keyword]
+    result = []
 
-    for i, char in enumerate(plaintext):
+    for i, char in enumerate(text, offset):
         if char.isalpha():
-            shift = ord(keyword[i % key_length]) - ord("A")
+            shift = shifts[i % key_length]
 
             if char.isupper():
-                encrypted_char = chr((ord(char) - ord("A") + shift) % 26 + ord("A"))
+                result.append(chr((ord(char) - ord("A") + shift) % 26 + ord("A")))
             else:
-                encrypted_char = chr((ord(char) - ord("a") + shift) % 26 + ord("a"))
-            ciphertext += encrypted_char
+                result.append(chr((ord(char) - ord("a") + shift) % 26 + ord("a")))
         else:
-            ciphertext += char
+            result.append(char)
+
+    return "".join(result)
+
 
-    return ciphertext
+def encrypt_vigenere(plaintext: str, keyword: str) -> str:
+    """
+    Encrypts plaintext using a Vigenere cipher.
+    >>> encrypt_vigenere("PYTHON", "A")
+    'PYTHON'
+    >>> encrypt_vigenere("python", "a")
+    'python'
+    >>> encrypt_vigenere("ATTACKATDAWN", "LEMON")
+    'LXFOPVEFRNHR'
+    """
+    return _shift_vigenere(plaintext, keyword, 1)
 
 
 def decrypt_vigenere(ciphertext: str, keyword: str) -> str:
@@ -37,19 +91,123 @@ def decrypt_vigenere(ciphertext: str, keyword: str) -> str:
     >>> decrypt_vigenere("LXFOPVEFRNHR", "LEMON")
     'ATTACKATDAWN'
     """
-    plaintext = ""
-    keyword = keyword.upper()
-    key_length = len(keyword)
+    return _shift_vigenere(ciphertext, keyword, -1)
 
-    for i, char in enumerate(ciphertext):
-        if char.isalpha():
-            shift = ord(keyword[i % key_length]) - ord("A")
 
-            if char.isupper():
-                decrypted_char = chr((ord(char) - ord("A") - shift) % 26 + ord("A"))
-            else:
-                decrypted_char = chr((ord(char) - ord("a") - shift) % 26 + ord("a"))
-            plaintext += decrypted_char
-        else:
-            plaintext += char
-    return plaintext
+def encrypt_vigenere_bytes(plaintext: ReadableBuffer, keyword: str) -> bytes:
+    """
+    Encrypts ASCII bytes using a Vigenere cipher.
+    >>> encrypt_vigenere_bytes(b"ATTACKATDAWN", "LEMON")
+    b'LXFOPVEFRNHR'
+    """
+    return _shift_vigenere_bytes(plaintext, keyword, 1)
+
+
+def decrypt_vigenere_bytes(ciphertext: ReadableBuffer, keyword: str) -> bytes:
+    """
+    Decrypts ASCII bytes using a Vigenere cipher.
+    >>> decrypt_vigenere_bytes(b"LXFOPVEFRNHR", "LEMON")
+    b'ATTACKATDAWN'
+    """
+    return _shift_vigenere_bytes(ciphertext, keyword, -1)
+
+
+def vigenere_xor(data: ReadableBuffer, key: bytes, offset: int = 0) -> bytes:
+    """
+    Vigenere cipher generalized to arbitrary bytes: every byte is XOR-ed with the key
+    byte standing at its position, so the same call encrypts and decrypts.
+    offset is the position of the first byte of data in the whole message.
+    >>> vigenere_xor(b"ATTACK", b"\\x01\\x02")
+    b'@VUCBI'
+    >>> vigenere_xor(b"VUCBI", b"\\x01\\x02", offset=1)
+    b'TTACK'
+    """
+    size = len(data)
+    if size == 0:
+        return b""
+    offset %= len(key)
+    keystream = (key[offset:] + key[:offset]) * (size // len(key) + 1)
+    value = int.from_bytes(data, "big") ^ int.from_bytes(keystream[:size], "big")
+    return value.to_bytes(size, "big")
+
+
+def _shift_vigenere_inplace(buffer: WritableBuffer, keyword: str, direction: int, chunk_size: int) -> None:
+    with memoryview(buffer) as view:
+        for start in range(0, len(view), chunk_size):
+            chunk = view[start : start + chunk_size]
+            chunk[:] = _shift_vigenere_bytes(chunk, keyword, direction, start)
+
+
+def encrypt_vigenere_inplace(buffer: WritableBuffer, keyword: str, chunk_size: int = CHUNK_SIZE) -> None:
+    """
+    Encrypts a writable ASCII buffer (bytearray, memoryview, mmap) in place, chunk by chunk.
+    >>> data = bytearray(b"ATTACKATDAWN")
+    >>> encrypt_vigenere_inplace(data, "LEMON", chunk_size=5)
+    >>> data
+    bytearray(b'LXFOPVEFRNHR')
+    """
+    _shift_vigenere_inplace(buffer, keyword, 1, chunk_size)
+
+
+def decrypt_vigenere_inplace(buffer: WritableBuffer, keyword: str, chunk_size: int = CHUNK_SIZE) -> None:
+    """Decrypts a writable ASCII buffer (bytearray, memoryview, mmap) in place, chunk by chunk"""
+    _shift_vigenere_inplace(buffer, keyword, -1, chunk_size)
+
+
+def encrypt_vigenere_mmap(path: tp.Union[str, pathlib.Path], keyword: str, chunk_size: int = CHUNK_SIZE) -> None:
+    """Encrypts an ASCII file in place through mmap without reading it into memory"""
+    with map_file(path) as buffer:
+        encrypt_vigenere_inplace(buffer, keyword, chunk_size)
+
+
+def decrypt_vigenere_mmap(path: tp.Union[str, pathlib.Path], keyword: str, chunk_size: int = CHUNK_SIZE) -> None:
+    """Decrypts an ASCII file in place through mmap without reading it into memory"""
+    with map_file(path) as buffer:
+        decrypt_vigenere_inplace(buffer, keyword, chunk_size)
+
+
+def _stream_vigenere(chunks: tp.Iterable[str], keyword: str, direction: int) -> tp.Iterator[str]:
+    offset = 0
+    for chunk in chunks:
+        yield _shift_vigenere(chunk, keyword, direction, offset)
+        offset = (offset + len(chunk)) % max(len(keyword), 1)
+
+
+def encrypt_vigenere_stream(chunks: tp.Iterable[str], keyword: str) -> tp.Iterator[str]:
+    """
+    Encrypts a stream of text chunks, carrying the key position across chunk boundaries.
+    >>> list(encrypt_vigenere_stream(["ATTAC", "KATDAWN"], "LEMON"))
+    ['LXFOP', 'VEFRNHR']
+    """
+    return _stream_vigenere(chunks, keyword, 1)
+
+
+def decrypt_vigenere_stream(chunks: tp.Iterable[str], keyword: str) -> tp.Iterator[str]:
+    """
+    Decrypts a stream of text chunks, carrying the key position across chunk boundaries.
+    >>> list(decrypt_vigenere_stream(["LXFOP", "VEFRNHR"], "LEMON"))
+    ['ATTAC', 'KATDAWN']
+    """
+    return _stream_vigenere(chunks, keyword, -1)
+
+
+def encrypt_vigenere_file(
+    src: tp.Union[str, pathlib.Path],
+    dst: tp.Union[str, pathlib.Path],
+    keyword: str,
+    chunk_size: int = CHUNK_SIZE,
+) -> None:
+    """Encrypts the file src into the file dst without loading it into memory"""
+    with pathlib.Path(src).open(newline="") as fin, pathlib.Path(dst).open("w", newline="") as fout:
+        fout.writelines(encrypt_vigenere_stream(read_chunks(fin, chunk_size), keyword))
+
+
+def decrypt_vigenere_file(
+    src: tp.Union[str, pathlib.Path],
+    dst: tp.Union[str, pathlib.Path],
+    keyword: str,
+    chunk_size: int = CHUNK_SIZE,
+) -> None:
+    """Decrypts the file src into the file dst without loading it into memory"""
+    with pathlib.Path(src).open(newline="") as fin, pathlib.Path(dst).open("w", newline="") as fout:
+        fout.writelines(decrypt_vigenere_stream(read_chunks(fin, chunk_size), keyword))
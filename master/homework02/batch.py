@@ -0,0 +1,180 @@
+import argparse
+import array
+import collections
+import concurrent.futures
+import functools
+import heapq
+import itertools
+import math
+import os
+import pathlib
+import time
+import typing as tp
+
+from homework02.sudoku import ENGINES, Grid, solve
+
+# (seconds, номер пазла, пазл) для самых долгих пазлов
+Slow = tp.Tuple[float, int, str]
+
+
+class SolveStats:
+    """Счётчики пакетного решения: скорость, задержки отдельных пазлов и самые долгие пазлы"""
+
+    def __init__(self, slowest: int = 5) -> None:
+        self.puzzles = 0
+        self.unsolved = 0
+        self.invalid = 0
+        self.seconds = 0.0
+        self.latencies = array.array("d")
+        self.max_slowest = slowest
+        self._slowest: tp.List[Slow] = []
+
+    def add(self, index: int, puzzle: str, seconds: float, solved: bool, invalid: bool = False) -> None:
+        """Учитывает один пазл, invalid - строка не разобралась как пазл"""
+        self.puzzles += 1
+        self.invalid += invalid
+        self.unsolved += not solved and not invalid
+        self.latencies.append(seconds)
+        if len(self._slowest) < self.max_slowest:
+            heapq.heappush(self._slowest, (seconds, index, puzzle))
+        elif self.max_slowest and seconds > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, (seconds, index, puzzle))
+
+    @property
+    def puzzles_per_second(self) -> float:
+        return self.puzzles / self.seconds if self.seconds else 0.0
+
+    @property
+    def slowest(self) -> tp.List[Slow]:
+        return sorted(self._slowest, reverse=True)
+
+    def percentile(self, q: float) -> float:
+        """
+        Задержка решения одного пазла, которую не превышают q процентов пазлов
+        >>> stats = SolveStats()
+        >>> for i in range(100):
+        ...     stats.add(i, '', i / 100, True)
+        >>> stats.percentile(50), stats.percentile(99)
+        (0.49, 0.98)
+        """
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[max(0, math.ceil(len(ordered) * q / 100) - 1)]
+
+    def __repr__(self) -> str:
+        return (
+            f"SolveStats(puzzles={self.puzzles}, unsolved={self.unsolved}, invalid={self.invalid}, "
+            f"seconds={self.seconds:.3f}, puzzles_per_second={self.puzzles_per_second:.1f}, "
+            f"p50={self.percentile(50):.4f}, p99={self.percentile(99):.4f})"
+        )
+
+
+def read_puzzles(path: tp.Union[str, pathlib.Path]) -> tp.Iterator[str]:
+    """Читает пазлы из файла по одному на строку, не загружая файл целиком"""
+    with pathlib.Path(path).open() as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield line
+
+
+def _solve_chunk(engine: str, chunk: tp.List[str]) -> tp.List[tp.Tuple[str, float, bool]]:
+    """(решение, секунды, строка не пазл) для каждого пазла куска"""
+    results = []
+    for puzzle in chunk:
+        start = time.perf_counter()
+        try:
+            solution = solve(Grid.from_line(puzzle), engine=engine)
+        except (ValueError, UnicodeError):
+            results.append(("", time.perf_counter() - start, True))
+            continue
+        results.append((str(solution) if solution else "", time.perf_counter() - start, False))
+    return results
+
+
+def solve_batch(
+    puzzles: tp.Iterable[str],
+    engine: str = "dlx",
+    chunk_size: int = 64,
+    max_workers: tp.Optional[int] = None,
+    max_pending: tp.Optional[int] = None,
+    stats: tp.Optional[SolveStats] = None,
+) -> tp.Iterator[str]:
+    """
+    Решает пазлы на пуле процессов и возвращает решения в порядке входа.
+    Пазлы отправляются кусками по chunk_size, и в работе не больше max_pending
+    кусков, поэтому вход любой длины не материализуется целиком.
+    Нерешаемый пазл и строка, которая не является пазлом, дают пустую строку.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine {engine!r}, expected one of {ENGINES}")
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_pending is None:
+        max_pending = 2 * max_workers
+    return _iter_batch(iter(puzzles), engine, chunk_size, max_workers, max_pending, stats or SolveStats())
+
+
+def _iter_batch(
+    puzzles: tp.Iterator[str],
+    engine: str,
+    chunk_size: int,
+    max_workers: int,
+    max_pending: int,
+    stats: SolveStats,
+) -> tp.Iterator[str]:
+    start = time.perf_counter()
+    process = functools.partial(_solve_chunk, engine)
+    with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+        pending: tp.Deque[tp.Tuple[tp.List[str], concurrent.futures.Future]] = collections.deque()
+        while True:
+            chunk = list(itertools.islice(puzzles, chunk_size))
+            if chunk:
+                pending.append((chunk, executor.submit(process, chunk)))
+            if pending and (not chunk or len(pending) >= max_pending):
+                submitted, future = pending.popleft()
+                for puzzle, (solution, seconds, invalid) in zip(submitted, future.result()):
+                    stats.add(stats.puzzles, puzzle, seconds, bool(solution), invalid)
+                    yield solution
+                stats.seconds = time.perf_counter() - start
+            if not chunk and not pending:
+                break
+
+
+def solve_file(
+    src: tp.Union[str, pathlib.Path],
+    dst: tp.Union[str, pathlib.Path],
+    engine: str = "dlx",
+    chunk_size: int = 64,
+    max_workers: tp.Optional[int] = None,
+    slowest: int = 5,
+) -> SolveStats:
+    """Решает файл пазлов по одному на строку и пишет решения в dst в том же порядке"""
+    stats = SolveStats(slowest)
+    with pathlib.Path(dst).open("w") as f:
+        for solution in solve_batch(read_puzzles(src), engine, chunk_size, max_workers, stats=stats):
+            f.write(solution + "\n")
+    return stats
+
+
+def main(argv: tp.Optional[tp.List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Решение файла пазлов на пуле процессов")
+    parser.add_argument("src", help="файл с пазлом из 81 символа на каждой строке")
+    parser.add_argument("dst", help="файл для решений")
+    parser.add_argument("--engine", choices=ENGINES, default="dlx")
+    parser.add_argument("--chunk-size", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--slowest", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    stats = solve_file(args.src, args.dst, args.engine, args.chunk_size, args.workers, args.slowest)
+    print(f"{stats.puzzles} puzzles ({stats.unsolved} unsolved, {stats.invalid} invalid) in {stats.seconds:.2f} s")
+    p50, p99 = stats.percentile(50) * 1000, stats.percentile(99) * 1000
+    print(f"{stats.puzzles_per_second:.1f} puzzles/s, p50 {p50:.2f} ms, p99 {p99:.2f} ms")
+    for seconds, index, puzzle in stats.slowest:
+        print(f"  #{index}: {seconds * 1000:.2f} ms {puzzle}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import itertools
 import pathlib
 import random
 import typing as tp
@@ -19,7 +20,92 @@ def create_grid(puzzle: str) -> tp.List[tp.List[str]]:
     return grid
 
 
-def display(grid: tp.List[tp.List[str]]) -> None:
+# Байты, которые не являются клетками сетки, для bytes.translate(None, delete)
+_NOT_CELLS = bytes(sorted(set(range(256)) - set(b"123456789.")))
+
+
+class Grid:
+    """Сетка в 81 байте по строкам: b"1".."9" для цифр и b"." для свободных клеток
+
+    Ведёт себя как последовательность из 9 строк, поэтому grid[row][col],
+    display и get_row/get_col/get_block работают с ней так же, как со списками.
+    >>> grid = Grid(b"53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79")
+    >>> grid[0][1], len(grid), get_col(grid, (0, 0))[:3]
+    ('3', 9, ['5', '6', '.'])
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes) -> None:
+        """Сохраняет ссылку на data без копирования"""
+        if len(data) != 81 or data.translate(None, _NOT_CELLS) != data:
+            raise ValueError(f"Expected 81 cells of 1-9 or '.', got {data[:100]!r}")
+        self.data = data
+
+    @classmethod
+    def from_line(cls, line: tp.Union[str, bytes]) -> "Grid":
+        """Сетка из строки пазла, окружающие пробелы и перевод строки отбрасываются"""
+        if isinstance(line, str):
+            line = line.encode("ascii")
+        if len(line) != 81:
+            line = line.strip()
+        return cls(line)
+
+    @classmethod
+    def from_rows(cls, grid: tp.List[tp.List[str]]) -> "Grid":
+        return cls("".join(itertools.chain.from_iterable(grid)).encode("ascii"))
+
+    def to_rows(self) -> tp.List[tp.List[str]]:
+        return group(list(self.data.decode("ascii")), 9)
+
+    def __len__(self) -> int:
+        return 9
+
+    def __getitem__(self, row: int) -> str:
+        if not 0 <= row < 9:
+            raise IndexError("Grid row out of range")
+        return self.data[row * 9 : row * 9 + 9].decode("ascii")
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Grid) and self.data == other.data
+
+    def __hash__(self) -> int:
+        return hash(self.data)
+
+    def __str__(self) -> str:
+        return self.data.decode("ascii")
+
+    def __repr__(self) -> str:
+        return f"Grid({self.data!r})"
+
+
+AnyGrid = tp.TypeVar("AnyGrid", tp.List[tp.List[str]], Grid)
+
+
+def read_grids(path: tp.Union[str, pathlib.Path]) -> tp.Iterator[Grid]:
+    """Читает пазлы по одному на строку, как в hard_puzzles.txt, не загружая файл целиком"""
+    with pathlib.Path(path).open("rb") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield Grid(line)
+
+
+def write_grids(path: tp.Union[str, pathlib.Path], grids: tp.Iterable[Grid]) -> None:
+    with pathlib.Path(path).open("wb") as f:
+        for grid in grids:
+            f.write(grid.data + b"\n")
+
+
+def read_grid(path: tp.Union[str, pathlib.Path]) -> Grid:
+    """Читает пазл в любом формате, как read_sudoku, но сразу в Grid
+    >>> read_grid('puzzle1.txt').to_rows() == read_sudoku('puzzle1.txt')
+    True
+    """
+    return Grid(pathlib.Path(path).read_bytes().translate(None, _NOT_CELLS))
+
+
+def display(grid: tp.Union[tp.List[tp.List[str]], Grid]) -> None:
     """Вывод Судоку"""
     width = 2
     line = "+".join(["-" * (width * 3)] * 3)
@@ -131,39 +217,448 @@ def find_possible_values(grid: tp.List[tp.List[str]], pos: tp.Tuple[int, int]) -
     return all_values - used_values
 
 
-def solve(grid: tp.List[tp.List[str]]) -> tp.Optional[tp.List[tp.List[str]]]:
-    """Решение пазла, заданного в grid"""
-    empty_pos = find_empty_positions(grid)
-    if empty_pos is None:
-        return grid
+DIGITS = "123456789"
+FULL_MASK = (1 << 9) - 1
+BOX_OF = [row // 3 * 3 + col // 3 for row in range(9) for col in range(9)]
+UNITS = (
+    [[row * 9 + col for col in range(9)] for row in range(9)]
+    + [[row * 9 + col for row in range(9)] for col in range(9)]
+    + [[pos for pos in range(81) if BOX_OF[pos] == box] for box in range(9)]
+)
 
-    row, col = empty_pos
 
-    possible_values = find_possible_values(grid, empty_pos)
+class Board:
+    """Состояние решателя: цифры клеток и 9-битные маски занятых цифр в строках, столбцах и квадратах
 
-    for value in possible_values:
-        new_grid = [row.copy() for row in grid]
-        new_grid[row][col] = value
+    Бит k маски означает цифру k + 1. Поставить и убрать цифру стоит несколько
+    битовых операций, поэтому перебор не копирует сетку и не строит множества.
+    >>> board = Board(read_sudoku('puzzle1.txt'))
+    >>> sorted(str(bit.bit_length()) for bit in board.bits(board.candidates(2)))
+    ['1', '2', '4']
+    """
 
-        solution = solve(new_grid)
-        if solution is not None:
-            return solution
+    __slots__ = ("cells", "rows", "cols", "boxes", "consistent")
 
-    return None
-    """ Как решать Судоку?
+    def __init__(self, grid: tp.Union[tp.List[tp.List[str]], Grid]) -> None:
+        self.cells = [0] * 81
+        self.rows = [0] * 9
+        self.cols = [0] * 9
+        self.boxes = [0] * 9
+        self.consistent = True
+        if isinstance(grid, Grid):
+            values = [0 if byte == 46 else byte - 48 for byte in grid.data]
+        else:
+            values = [0 if value == "." else DIGITS.index(value) + 1 for row in grid for value in row]
+        for pos, value in enumerate(values):
+            if value:
+                bit = 1 << (value - 1)
+                if not self.candidates(pos) & bit:
+                    self.consistent = False
+                self.place(pos, bit)
+
+    def candidates(self, pos: int) -> int:
+        """Маска цифр, которые можно поставить в клетку pos"""
+        return FULL_MASK & ~(self.rows[pos // 9] | self.cols[pos % 9] | self.boxes[BOX_OF[pos]])
+
+    def place(self, pos: int, bit: int) -> None:
+        self.cells[pos] = bit.bit_length()
+        self.rows[pos // 9] |= bit
+        self.cols[pos % 9] |= bit
+        self.boxes[BOX_OF[pos]] |= bit
+
+    def remove(self, pos: int, bit: int) -> None:
+        """Отменяет place, цифра bit должна была отсутствовать в строке, столбце и квадрате до place"""
+        self.cells[pos] = 0
+        self.rows[pos // 9] ^= bit
+        self.cols[pos % 9] ^= bit
+        self.boxes[BOX_OF[pos]] ^= bit
+
+    @staticmethod
+    def bits(mask: int) -> tp.Iterator[int]:
+        while mask:
+            bit = mask & -mask
+            yield bit
+            mask ^= bit
+
+    def empty(self) -> tp.List[int]:
+        return [pos for pos in range(81) if not self.cells[pos]]
+
+    def to_grid(self) -> tp.List[tp.List[str]]:
+        return group([DIGITS[value - 1] if value else "." for value in self.cells], 9)
+
+    def to_bytes(self) -> bytes:
+        return bytes([48 + value if value else 46 for value in self.cells])
+
+    def convert(self, like: tp.Union[tp.List[tp.List[str]], Grid]) -> tp.Any:
+        """Сетка того же типа, что и like"""
+        return Grid(self.to_bytes()) if isinstance(like, Grid) else self.to_grid()
+
+
+def _search_first(board: Board, empty: tp.List[int], i: int) -> bool:
+    if i == len(empty):
+        return True
+    pos = empty[i]
+    for bit in board.bits(board.candidates(pos)):
+        board.place(pos, bit)
+        if _search_first(board, empty, i + 1):
+            return True
+        board.remove(pos, bit)
+    return False
+
+
+def _propagate(board: Board, trail: tp.List[tp.Tuple[int, int]]) -> bool:
+    """Ставит голые и скрытые одиночки, пока они есть, и записывает ходы в trail
+
+    Скрытые одиночки ищутся, только если исходные цифры не противоречат друг другу:
+    с повторами в строке часть цифр в ней так и не появится.
+    """
+    cells = board.cells
+    changed = True
+    while changed:
+        changed = False
+        for pos in range(81):
+            if not cells[pos]:
+                mask = board.candidates(pos)
+                if not mask:
+                    return False
+                if not mask & (mask - 1):
+                    board.place(pos, mask)
+                    trail.append((pos, mask))
+                    changed = True
+        if not board.consistent:
+            continue
+        for unit in UNITS:
+            once = twice = placed = 0
+            for pos in unit:
+                if cells[pos]:
+                    placed |= 1 << (cells[pos] - 1)
+                else:
+                    mask = board.candidates(pos)
+                    twice |= once & mask
+                    once |= mask
+            if once | placed != FULL_MASK:
+                return False
+            hidden = once & ~twice & ~placed
+            if not hidden:
+                continue
+            for pos in unit:
+                if not cells[pos]:
+                    mask = board.candidates(pos) & hidden
+                    if mask & (mask - 1):
+                        return False
+                    if mask:
+                        board.place(pos, mask)
+                        trail.append((pos, mask))
+                        changed = True
+    return True
+
+
+def _choose_cell(board: Board) -> tp.Tuple[int, int]:
+    """Свободная клетка с наименьшим числом кандидатов и её кандидаты, (-1, 0) для заполненной сетки"""
+    best, best_mask, best_count = -1, 0, 10
+    for pos in range(81):
+        if not board.cells[pos]:
+            mask = board.candidates(pos)
+            count = mask.bit_count()
+            if count < best_count:
+                best, best_mask, best_count = pos, mask, count
+                if count == 2:
+                    break
+    return best, best_mask
+
+
+def _search_mrv(board: Board, rng: tp.Optional[random.Random] = None) -> bool:
+    """Перебор с MRV и одиночками, rng перемешивает кандидатов для случайного решения"""
+    trail: tp.List[tp.Tuple[int, int]] = []
+    if _propagate(board, trail):
+        pos, mask = _choose_cell(board)
+        if pos < 0:
+            return True
+        order = list(board.bits(mask))
+        if rng is not None:
+            rng.shuffle(order)
+        for bit in order:
+            board.place(pos, bit)
+            if _search_mrv(board, rng):
+                return True
+            board.remove(pos, bit)
+    for pos, bit in reversed(trail):
+        board.remove(pos, bit)
+    return False
+
+
+def _count_mrv(board: Board, limit: int) -> int:
+    """Считает решения, но не больше limit, и возвращает board в исходное состояние"""
+    trail: tp.List[tp.Tuple[int, int]] = []
+    count = 0
+    if _propagate(board, trail):
+        pos, mask = _choose_cell(board)
+        if pos < 0:
+            count = 1
+        for bit in board.bits(mask):
+            board.place(pos, bit)
+            count += _count_mrv(board, limit - count)
+            board.remove(pos, bit)
+            if count >= limit:
+                break
+    for pos, bit in reversed(trail):
+        board.remove(pos, bit)
+    return count
+
+
+STRATEGIES: tp.Dict[str, tp.Callable[[Board], bool]] = {
+    "first": lambda board: _search_first(board, board.empty(), 0),
+    "mrv": _search_mrv,
+}
+
+
+class DancingLinks:
+    """Точное покрытие алгоритмом X на танцующих ссылках (DLX)
+
+    Узлы хранятся в параллельных списках индексов вместо объектов: узел 0 - корень,
+    узлы 1..columns - заголовки столбцов, дальше узлы строк. Первые primary
+    столбцов обязательны, остальные вторичные - покрываются не более одного раза
+    и не попадают в список корня.
+    """
+
+    __slots__ = ("left", "right", "up", "down", "column", "row", "size")
+
+    def __init__(self, columns: int, primary: tp.Optional[int] = None) -> None:
+        primary = columns if primary is None else primary
+        nodes = range(columns + 1)
+        self.left = [i - 1 if 0 < i <= primary else i for i in nodes]
+        self.right = [i + 1 if i < primary else i for i in nodes]
+        self.left[0], self.right[primary] = primary, 0
+        self.up = list(nodes)
+        self.down = list(nodes)
+        self.column = list(nodes)
+        self.row = [-1] * (columns + 1)
+        self.size = [0] * (columns + 1)
+
+    def unlink(self, column: int) -> None:
+        """Убирает столбец из списка корня, если он не нужен в покрытии"""
+        left, right = self.left, self.right
+        right[left[column]] = right[column]
+        left[right[column]] = left[column]
+        left[column] = right[column] = column
+
+    def add_row(self, row: int, columns: tp.Iterable[int]) -> None:
+        left, right, up, down = self.left, self.right, self.up, self.down
+        first = -1
+        for c in columns:
+            node = len(up)
+            left.append(node)
+            right.append(node)
+            up.append(up[c])
+            down.append(c)
+            down[up[c]] = node
+            up[c] = node
+            self.column.append(c)
+            self.row.append(row)
+            self.size[c] += 1
+            if first < 0:
+                first = node
+            else:
+                left[node], right[node] = left[first], first
+                right[left[first]] = node
+                left[first] = node
+
+    def cover(self, c: int) -> None:
+        left, right, up, down, column, size = self.left, self.right, self.up, self.down, self.column, self.size
+        right[left[c]] = right[c]
+        left[right[c]] = left[c]
+        i = down[c]
+        while i != c:
+            j = right[i]
+            while j != i:
+                down[up[j]] = down[j]
+                up[down[j]] = up[j]
+                size[column[j]] -= 1
+                j = right[j]
+            i = down[i]
+
+    def uncover(self, c: int) -> None:
+        left, right, up, down, column, size = self.left, self.right, self.up, self.down, self.column, self.size
+        i = up[c]
+        while i != c:
+            j = left[i]
+            while j != i:
+                size[column[j]] += 1
+                down[up[j]] = j
+                up[down[j]] = j
+                j = left[j]
+            i = up[i]
+        right[left[c]] = c
+        left[right[c]] = c
+
+    def solutions(self) -> tp.Iterator[tp.List[int]]:
+        """Перебирает все точные покрытия, каждое - список номеров строк"""
+        chosen: tp.List[int] = []
+        yield from self._search(chosen)
+
+    def _search(self, chosen: tp.List[int]) -> tp.Iterator[tp.List[int]]:
+        right, down, size = self.right, self.down, self.size
+        c = right[0]
+        if c == 0:
+            yield list(chosen)
+            return
+        best = c
+        while c != 0 and size[best] > 1:
+            if size[c] < size[best]:
+                best = c
+            c = right[c]
+        self.cover(best)
+        r = down[best]
+        while r != best:
+            chosen.append(self.row[r])
+            j = right[r]
+            while j != r:
+                self.cover(self.column[j])
+                j = right[j]
+            yield from self._search(chosen)
+            j = self.left[r]
+            while j != r:
+                self.uncover(self.column[j])
+                j = self.left[j]
+            chosen.pop()
+            r = down[r]
+        self.uncover(best)
+
+
+def _exact_cover(board: Board) -> DancingLinks:
+    """Строит матрицу покрытия для свободных клеток board
+
+    Столбцы: клетка, цифра в строке, в столбце, в квадрате. Строка матрицы -
+    номер pos * 9 + цифра - 1 для каждого кандидата. Если исходные цифры
+    противоречат друг другу, ограничения на цифры делаются вторичными, чтобы
+    заполнить свободные клетки так же, как это делает перебор.
+    """
+    primary = 324 if board.consistent else 81
+    dlx = DancingLinks(324, primary)
+    for pos in range(81):
+        row, col, box = pos // 9, pos % 9, BOX_OF[pos]
+        if board.cells[pos]:
+            dlx.unlink(1 + pos)
+            continue
+        for bit in board.bits(board.candidates(pos)):
+            d = bit.bit_length() - 1
+            dlx.add_row(pos * 9 + d, (1 + pos, 82 + row * 9 + d, 163 + col * 9 + d, 244 + box * 9 + d))
+    for i, mask in enumerate(board.rows + board.cols + board.boxes):
+        for bit in board.bits(mask):
+            dlx.unlink(82 + i * 9 + bit.bit_length() - 1)
+    return dlx
+
+
+def _solutions_dlx(board: Board) -> tp.Iterator[Board]:
+    dlx = _exact_cover(board)
+    for rows in dlx.solutions():
+        for r in rows:
+            board.place(r // 9, 1 << r % 9)
+        yield board
+        for r in rows:
+            board.remove(r // 9, 1 << r % 9)
+
+
+ENGINES = ("bitmask", "dlx")
+
+
+def solve(grid: AnyGrid, strategy: str = "mrv", engine: str = "bitmask") -> tp.Optional[AnyGrid]:
+    """Решение пазла, заданного в grid
+
+    strategy выбирает порядок перебора из STRATEGIES: "first" берёт первую свободную
+    клетку по строкам, "mrv" - клетку с наименьшим числом кандидатов и после
+    каждого хода расставляет голые и скрытые одиночки.
+    engine "dlx" решает пазл как задачу точного покрытия, strategy при этом не используется.
+    Для Grid решение тоже возвращается как Grid.
+
+    Как решать Судоку?
         1. Найти свободную позицию
         2. Найти все возможные значения, которые могут находиться на этой позиции
         3. Для каждого возможного значения:
             3.1. Поместить это значение на эту позицию
             3.2. Продолжить решать оставшуюся часть пазла
+            3.3. Если решения нет, убрать значение и попробовать следующее
     >>> grid = read_sudoku('puzzle1.txt')
     >>> solve(grid)
     [['5', '3', '4', '6', '7', '8', '9', '1', '2'], ['6', '7', '2', '1', '9', '5', '3', '4', '8'], ['1', '9', '8', '3', '4', '2', '5', '6', '7'], ['8', '5', '9', '7', '6', '1', '4', '2', '3'], ['4', '2', '6', '8', '5', '3', '7', '9', '1'], ['7', '1', '3', '9', '2', '4', '8', '5', '6'], ['9', '6', '1', '5', '3', '7', '2', '8', '4'], ['2', '8', '7', '4', '1', '9', '6', '3', '5'], ['3', '4', '5', '2', '8', '6', '1', '7', '9']]
     """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine: {engine}")
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy: {strategy}")
+    board = Board(grid)
+    if engine == "dlx":
+        return next((solved.convert(grid) for solved in _solutions_dlx(board)), None)
+    if not STRATEGIES[strategy](board):
+        return None
+    return board.convert(grid)
+
+
+def count_solutions(grid: tp.Union[tp.List[tp.List[str]], Grid], limit: int = 2, engine: str = "bitmask") -> int:
+    """Число решений пазла, но не больше limit
+    >>> count_solutions(read_sudoku('puzzle1.txt'))
+    1
+    >>> count_solutions(create_grid('.' * 81), limit=10, engine="dlx")
+    10
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine: {engine}")
+    board = Board(grid)
+    if engine == "dlx":
+        return sum(1 for _ in itertools.islice(_solutions_dlx(board), limit))
+    return _count_mrv(board, limit)
+
+
+def is_unique(grid: tp.Union[tp.List[tp.List[str]], Grid]) -> bool:
+    """Есть ли у пазла ровно одно решение
+    >>> is_unique(read_sudoku('puzzle1.txt'))
+    True
+    >>> is_unique(create_grid('.' * 81))
+    False
+    """
+    return count_solutions(grid, limit=2) == 1
+
+
+def _remove_clues(board: Board, target: int, rng: random.Random) -> None:
+    """Убирает цифры в случайном порядке, пока их больше target и решение остаётся единственным
+
+    Цифру d в клетке pos можно убрать, если пазл без неё не решается ни с одной
+    другой цифрой в pos. Проверка идёт на том же board: маски меняются на одну
+    цифру, а поиск возвращает их в исходное состояние.
+    """
+    positions = [pos for pos in range(81) if board.cells[pos]]
+    rng.shuffle(positions)
+    clues = len(positions)
+    for pos in positions:
+        if clues <= target:
+            break
+        bit = 1 << (board.cells[pos] - 1)
+        board.remove(pos, bit)
+        for other in board.bits(board.candidates(pos) & ~bit):
+            board.place(pos, other)
+            found = _count_mrv(board, 1)
+            board.remove(pos, other)
+            if found:
+                board.place(pos, bit)
+                break
+        else:
+            clues -= 1
+
 
+def _check_bytes(data: bytes) -> bool:
+    digits = set(b"123456789")
+    starts = [row * 27 + col * 3 for row in range(3) for col in range(3)]
+    return (
+        all(set(data[i : i + 9]) == digits for i in range(0, 81, 9))
+        and all(set(data[i::9]) == digits for i in range(9))
+        and all(set(data[i : i + 3] + data[i + 9 : i + 12] + data[i + 18 : i + 21]) == digits for i in starts)
+    )
 
-def check_solution(solution: tp.List[tp.List[str]]) -> bool:
+
+def check_solution(solution: tp.Union[tp.List[tp.List[str]], Grid]) -> bool:
     """Если решение solution верно, то вернуть True, в противном случае False"""
+    if isinstance(solution, Grid):
+        return _check_bytes(solution.data)
 
     for row in solution:
         if "." in row:
@@ -188,8 +683,84 @@ def check_solution(solution: tp.List[tp.List[str]]) -> bool:
     return True
 
 
-def generate_sudoku(N: int) -> tp.List[tp.List[str]]:
+def random_solution(rng: tp.Optional[random.Random] = None) -> tp.List[tp.List[str]]:
+    """Случайная заполненная сетка: перебор с MRV, в котором кандидаты перемешаны
+    >>> check_solution(random_solution())
+    True
+    >>> random_solution(random.Random(1)) == random_solution(random.Random(1))
+    True
+    """
+    board = Board(create_grid("." * 81))
+    _search_mrv(board, rng or random.Random())
+    return board.to_grid()
+
+
+# Все 1296 порядков строк (или столбцов), сохраняющих полосы: перестановка полос и строк внутри каждой
+LINE_ORDERS = [
+    tuple(band * 3 + line for band, lines in zip(bands, inner) for line in lines)
+    for bands in itertools.permutations(range(3))
+    for inner in itertools.product(itertools.permutations(range(3)), repeat=3)
+]
+
+
+def transform(puzzle: str, rng: random.Random) -> str:
+    """Случайное преобразование пазла из 81 символа, сохраняющее его решения
+
+    Переставляет цифры, строки внутри полос и сами полосы, столбцы внутри
+    колонн и сами колонны и с вероятностью 1/2 транспонирует сетку.
+    >>> solution = "".join(sum(random_solution(random.Random(0)), []))
+    >>> check_solution(group(list(transform(solution, random.Random(1))), 9))
+    True
+    """
+    rows = rng.choice(LINE_ORDERS)
+    cols = rng.choice(LINE_ORDERS)
+    if rng.random() < 0.5:
+        order = [rows[c] * 9 + cols[r] for r in range(9) for c in range(9)]
+    else:
+        order = [rows[r] * 9 + cols[c] for r in range(9) for c in range(9)]
+    digits = list(DIGITS)
+    rng.shuffle(digits)
+    return "".join([puzzle[i] for i in order]).translate(str.maketrans(DIGITS, "".join(digits)))
+
+
+def generate_puzzles(
+    count: int,
+    N: int,
+    unique: bool = False,
+    pool_size: int = 8,
+    seed: tp.Optional[int] = None,
+) -> tp.Iterator[str]:
+    """Поток из count пазлов по 81 символу с N цифрами
+
+    Сначала строится pool_size пазлов через generate_sudoku, а каждый следующий
+    пазл - случайное преобразование одного из них. Преобразования сохраняют
+    число решений, поэтому с unique=True все пазлы имеют единственное решение.
+    При одинаковом seed поток повторяется.
+    >>> puzzles = list(generate_puzzles(100, 30, unique=True, pool_size=2, seed=1))
+    >>> len(set(puzzles)), all(is_unique(create_grid(puzzle)) for puzzle in puzzles)
+    (100, True)
+    >>> puzzles == list(generate_puzzles(100, 30, unique=True, pool_size=2, seed=1))
+    True
+    """
+    rng = random.Random(seed)
+    pool = ["".join(sum(generate_sudoku(N, unique, rng), [])) for _ in range(min(count, pool_size))]
+    for i in range(count):
+        yield pool[i] if i < len(pool) else transform(rng.choice(pool), rng)
+
+
+def generate_sudoku(N: int, unique: bool = False, rng: tp.Optional[random.Random] = None) -> tp.List[tp.List[str]]:
     """Генерация судоку заполненного на N элементов
+
+    Заполненная сетка каждый раз случайная, rng делает результат воспроизводимым.
+    С unique=True цифры убираются по одной, пока решение единственно, поэтому
+    если меньше N цифр не получить с единственным решением, их останется больше N.
+    >>> grid = generate_sudoku(30, unique=True)
+    >>> sum(1 for row in grid for e in row if e != '.') >= 30
+    True
+    >>> is_unique(grid)
+    True
+    >>> generate_sudoku(30, rng=random.Random(2)) == generate_sudoku(30, rng=random.Random(2))
+    True
     >>> grid = generate_sudoku(40)
     >>> sum(1 for row in grid for e in row if e == '.')
     41
@@ -209,16 +780,19 @@ def generate_sudoku(N: int) -> tp.List[tp.List[str]]:
     >>> check_solution(solution)
     True
     """
-    grid = [["." for _ in range(9)] for _ in range(9)]
+    rng = rng or random.Random()
+    solution = random_solution(rng)
 
-    solution = solve(grid)
+    if unique:
+        board = Board(solution)
+        _remove_clues(board, N, rng)
+        return board.to_grid()
 
-    if solution is None:
-        return grid
+    grid = [["." for _ in range(9)] for _ in range(9)]
 
     positions = [(i, j) for i in range(9) for j in range(9)]
 
-    random.shuffle(positions)
+    rng.shuffle(positions)
 
     filled = 0
     for i, j in positions:
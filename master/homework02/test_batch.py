@@ -0,0 +1,54 @@
+import itertools
+import pathlib
+import tempfile
+import unittest
+
+import homework02.batch as batch
+import homework02.sudoku as sudoku
+
+HARD_PUZZLES = pathlib.Path(__file__).parent / "hard_puzzles.txt"
+
+
+class BatchTestCase(unittest.TestCase):
+    def test_solve_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src, dst = pathlib.Path(tmp) / "puzzles.txt", pathlib.Path(tmp) / "solutions.txt"
+            puzzles = HARD_PUZZLES.read_text().split()[:20]
+            unsolvable = "12345678." + "." * 8 + "9" + "." * 63
+            src.write_text("\n".join(puzzles[:10] + [unsolvable, ""] + puzzles[10:]) + "\n")
+            stats = batch.solve_file(src, dst, chunk_size=3, max_workers=2, slowest=3)
+            solutions = dst.read_text().split("\n")[:-1]
+
+        self.assertEqual(21, len(solutions))
+        self.assertEqual("", solutions[10])
+        for puzzle, solution in zip(puzzles, solutions[:10] + solutions[11:]):
+            self.assertTrue(sudoku.check_solution(sudoku.create_grid(solution)))
+            self.assertTrue(all(given in (".", value) for given, value in zip(puzzle, solution)))
+        self.assertEqual(21, stats.puzzles)
+        self.assertEqual(1, stats.unsolved)
+        self.assertEqual(0, stats.invalid)
+        self.assertEqual(3, len(stats.slowest))
+        self.assertEqual(max(stats.latencies), stats.slowest[0][0])
+        self.assertLessEqual(stats.percentile(50), stats.percentile(99))
+        self.assertGreater(stats.puzzles_per_second, 0)
+
+    def test_invalid_lines(self):
+        puzzles = HARD_PUZZLES.read_text().split()[:2]
+        lines = [puzzles[0], "0" * 81, "puzzle,solution", "ё" * 81, puzzles[1]]
+        stats = batch.SolveStats()
+        solutions = list(batch.solve_batch(lines, chunk_size=2, max_workers=1, stats=stats))
+        self.assertEqual(5, len(solutions))
+        self.assertEqual(["", "", ""], solutions[1:4])
+        self.assertTrue(sudoku.check_solution(sudoku.Grid.from_line(solutions[0])))
+        self.assertTrue(sudoku.check_solution(sudoku.Grid.from_line(solutions[4])))
+        self.assertEqual(3, stats.invalid)
+        self.assertEqual(0, stats.unsolved)
+
+    def test_endless_input(self):
+        puzzles = itertools.cycle(HARD_PUZZLES.read_text().split()[:3])
+        solutions = batch.solve_batch(puzzles, chunk_size=4, max_workers=2, max_pending=2)
+        self.assertEqual(10, len(list(itertools.islice(solutions, 10))))
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            batch.solve_batch([], engine="numpy")
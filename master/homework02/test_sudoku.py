@@ -1,3 +1,6 @@
+import pathlib
+import random
+import tempfile
 import unittest
 
 import homework02.sudoku as sudoku
@@ -170,6 +173,60 @@ class SudokuTestCase(unittest.TestCase):
         actual_solution = sudoku.solve(grid)
         self.assertEqual(expected_solution, actual_solution)
 
+    def test_solve_strategies(self):
+        lines = (pathlib.Path(__file__).parent / "hard_puzzles.txt").read_text().split()
+        for line in lines[:5]:
+            grid = sudoku.create_grid(line)
+            solution = sudoku.solve(grid, strategy="mrv")
+            self.assertTrue(sudoku.check_solution(solution))
+            self.assertTrue(all(given in (".", value) for given, value in zip(line, sum(solution, []))))
+        grid = sudoku.create_grid(lines[2])
+        self.assertEqual(sudoku.solve(grid, strategy="mrv"), sudoku.solve(grid, strategy="first"))
+
+        unsolvable = sudoku.create_grid("12345678." + "." * 8 + "9" + "." * 63)
+        for strategy in sudoku.STRATEGIES:
+            self.assertIsNone(sudoku.solve(unsolvable, strategy=strategy))
+        with self.assertRaises(ValueError):
+            sudoku.solve(grid, strategy="random")
+
+    def test_solve_dlx(self):
+        lines = (pathlib.Path(__file__).parent / "hard_puzzles.txt").read_text().split()
+        for line in lines[:5]:
+            grid = sudoku.create_grid(line)
+            self.assertEqual(sudoku.solve(grid), sudoku.solve(grid, engine="dlx"))
+
+        grid = [
+            ["6", "6", "1", "1", "1", "5", "8", "3", "7"],
+            ["3", "5", "7", "8", "2", "6", "1", "4", "9"],
+            ["1", "4", "8", "9", "3", ".", ".", "2", "6"],
+            ["6", "3", "9", "5", "1", "2", "4", "7", "8"],
+            ["5", ".", "1", "7", "6", ".", "3", ".", "2"],
+            ["4", "7", "2", "3", ".", "8", "6", "1", "5"],
+            ["9", "6", "4", "2", "8", "3", "7", "5", "1"],
+            ["8", "1", ".", "4", "7", "9", "2", "6", "3"],
+            ["7", "2", ".", "6", "5", "1", "9", "8", "."],
+        ]
+        self.assertEqual(sudoku.solve(grid), sudoku.solve(grid, engine="dlx"))
+        self.assertIsNone(sudoku.solve(sudoku.create_grid("12345678." + "." * 8 + "9" + "." * 63), engine="dlx"))
+        with self.assertRaises(ValueError):
+            sudoku.solve(grid, engine="numpy")
+
+    def test_count_solutions(self):
+        grid = sudoku.read_sudoku(pathlib.Path(__file__).parent / "puzzle1.txt")
+        self.assertEqual(1, sudoku.count_solutions(grid))
+        solution = sudoku.solve(grid)
+        self.assertEqual(1, sudoku.count_solutions(solution))
+        self.assertEqual(0, sudoku.count_solutions(sudoku.create_grid("12345678." + "." * 8 + "9" + "." * 63)))
+        self.assertEqual(5, sudoku.count_solutions(sudoku.create_grid("." * 81), limit=5))
+
+        # замена 1 <-> 2 во всей сетке даёт второе решение
+        grid = [["." if value in "12" else value for value in row] for row in solution]
+        for engine in sudoku.ENGINES:
+            self.assertEqual(2, sudoku.count_solutions(grid, engine=engine))
+            self.assertEqual(1, sudoku.count_solutions(grid, limit=1, engine=engine))
+        self.assertFalse(sudoku.is_unique(grid))
+        self.assertTrue(sudoku.is_unique(solution))
+
     def test_check_solution(self):
         good_solution = [
             ["5", "3", "4", "6", "7", "8", "9", "1", "2"],
@@ -240,3 +297,79 @@ class SudokuTestCase(unittest.TestCase):
         solution = sudoku.solve(grid)
         solved = sudoku.check_solution(solution)
         self.assertTrue(solved)
+
+    def test_generate_unique_sudoku(self):
+        for n in [81, 40, 25]:
+            grid = sudoku.generate_sudoku(n, unique=True)
+            clues = sum(1 for row in grid for e in row if e != ".")
+            self.assertGreaterEqual(clues, n)
+            self.assertLessEqual(clues, n + 5)
+            self.assertEqual(1, sudoku.count_solutions(grid, engine="dlx"))
+            self.assertTrue(sudoku.check_solution(sudoku.solve(grid)))
+
+    def test_random_solution(self):
+        solutions = [sudoku.random_solution() for _ in range(5)]
+        self.assertEqual(5, len({str(solution) for solution in solutions}))
+        for solution in solutions:
+            self.assertTrue(sudoku.check_solution(solution))
+        self.assertEqual(sudoku.random_solution(random.Random(7)), sudoku.random_solution(random.Random(7)))
+        self.assertEqual(
+            sudoku.generate_sudoku(30, unique=True, rng=random.Random(7)),
+            sudoku.generate_sudoku(30, unique=True, rng=random.Random(7)),
+        )
+
+    def test_transform(self):
+        rng = random.Random(3)
+        puzzle = "".join(sum(sudoku.generate_sudoku(30, unique=True, rng=rng), []))
+        for _ in range(20):
+            transformed = sudoku.transform(puzzle, rng)
+            self.assertEqual(puzzle.count("."), transformed.count("."))
+            counts = sorted(puzzle.count(digit) for digit in "123456789")
+            self.assertEqual(counts, sorted(transformed.count(digit) for digit in "123456789"))
+            grid = sudoku.create_grid(transformed)
+            self.assertTrue(sudoku.is_unique(grid))
+            self.assertTrue(sudoku.check_solution(sudoku.solve(grid)))
+
+    def test_generate_puzzles(self):
+        puzzles = list(sudoku.generate_puzzles(500, 28, unique=True, pool_size=3, seed=5))
+        self.assertEqual(500, len(set(puzzles)))
+        self.assertTrue(all(len(puzzle) == 81 for puzzle in puzzles))
+        self.assertEqual(puzzles, list(sudoku.generate_puzzles(500, 28, unique=True, pool_size=3, seed=5)))
+        for puzzle in puzzles[::50]:
+            self.assertTrue(sudoku.is_unique(sudoku.create_grid(puzzle)))
+
+    def test_grid(self):
+        line = (pathlib.Path(__file__).parent / "hard_puzzles.txt").read_text().split()[0]
+        data = line.encode()
+        grid = sudoku.Grid(data)
+        self.assertIs(data, grid.data)
+        self.assertEqual(grid, sudoku.Grid.from_line(line + "\n"))
+        self.assertEqual(line, str(grid))
+        self.assertEqual(sudoku.create_grid(line), grid.to_rows())
+        self.assertEqual(grid, sudoku.Grid.from_rows(sudoku.create_grid(line)))
+        self.assertEqual(line[9:18], grid[1])
+        self.assertEqual(sudoku.get_block(sudoku.create_grid(line), (4, 4)), sudoku.get_block(grid, (4, 4)))
+        for bad in [line[:80], line[:80] + "0", line + "1"]:
+            with self.assertRaises(ValueError):
+                sudoku.Grid.from_line(bad)
+
+        solution = sudoku.solve(grid)
+        self.assertIsInstance(solution, sudoku.Grid)
+        self.assertEqual(sudoku.solve(sudoku.create_grid(line)), solution.to_rows())
+        self.assertEqual(solution, sudoku.solve(grid, engine="dlx"))
+        self.assertTrue(sudoku.check_solution(solution))
+        self.assertFalse(sudoku.check_solution(grid))
+        self.assertTrue(sudoku.is_unique(grid))
+        swapped = str(solution)[1] + str(solution)[0] + str(solution)[2:]
+        self.assertFalse(sudoku.check_solution(sudoku.Grid.from_line(swapped)))
+        self.assertFalse(sudoku.check_solution(sudoku.Grid.from_line("123456789" * 9)))
+
+    def test_read_write_grids(self):
+        lines = (pathlib.Path(__file__).parent / "hard_puzzles.txt").read_text().split()[:10]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = pathlib.Path(tmp) / "grids.txt"
+            sudoku.write_grids(path, map(sudoku.Grid.from_line, lines))
+            self.assertEqual("\n".join(lines) + "\n", path.read_text())
+            self.assertEqual(lines, [str(grid) for grid in sudoku.read_grids(path)])
+        grid = sudoku.read_grid(pathlib.Path(__file__).parent / "puzzle1.txt")
+        self.assertEqual(sudoku.read_sudoku(pathlib.Path(__file__).parent / "puzzle1.txt"), grid.to_rows())
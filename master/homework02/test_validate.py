@@ -0,0 +1,40 @@
+import unittest
+
+import homework02.sudoku as sudoku
+
+try:
+    import numpy as np
+
+    import homework02.validate as validate
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+class ValidateTestCase(unittest.TestCase):
+    def test_check_solutions(self):
+        solutions = [sudoku.Grid.from_line(line) for line in sudoku.generate_puzzles(50, 81, seed=1)]
+        grids = validate.to_array(solutions)
+        self.assertEqual((50, 9, 9), grids.shape)
+        self.assertEqual(np.uint8, grids.dtype)
+        self.assertTrue(validate.check_solutions(grids).all())
+
+        broken = grids.copy()
+        broken[1, 0, 0], broken[1, 0, 1] = broken[1, 0, 1], broken[1, 0, 0]  # столбцы и квадраты ломаются
+        broken[2, 4, 4] = 0
+        broken[3, 8, 8] = 10
+        broken[4] = np.arange(1, 10)
+        broken[5] = np.arange(1, 10)[:, None]
+        mask = validate.check_solutions(broken, chunk_size=7)
+        self.assertEqual([True, False, False, False, False, False] + [True] * 44, mask.tolist())
+        rows = [[[str(value) if 1 <= value <= 9 else "." for value in row] for row in grid] for grid in broken]
+        self.assertEqual([sudoku.check_solution(grid) for grid in rows], mask.tolist())
+
+    def test_puzzles(self):
+        puzzles = [sudoku.Grid.from_line(line) for line in sudoku.generate_puzzles(5, 30, seed=2)]
+        self.assertFalse(validate.check_solutions(validate.to_array(puzzles)).any())
+        self.assertEqual(0, len(validate.check_solutions(np.zeros((0, 9, 9), dtype=np.uint8))))
+        with self.assertRaises(ValueError):
+            validate.check_solutions(np.zeros((2, 81), dtype=np.uint8))
@@ -0,0 +1,53 @@
+import typing as tp
+
+import numpy as np
+
+from homework02.sudoku import Grid
+
+# Маска всех цифр 1..9: бит d для цифры d
+ALL_DIGITS = sum(1 << digit for digit in range(1, 10))
+CHUNK_SIZE = 1 << 16
+
+
+def to_array(grids: tp.Iterable[Grid]) -> np.ndarray:
+    """
+    Сетки как массив (N, 9, 9) uint8 с цифрами 1..9 и 0 для свободных клеток
+    >>> to_array([Grid(b"123456789" * 8 + b"........9")])[0, 8]
+    array([0, 0, 0, 0, 0, 0, 0, 0, 9], dtype=uint8)
+    """
+    array = np.frombuffer(b"".join(grid.data for grid in grids), dtype=np.uint8).reshape(-1, 9, 9) - ord("0")
+    array[array > 9] = 0
+    return array
+
+
+def _units(grids: np.ndarray) -> np.ndarray:
+    """Строки, столбцы и квадраты каждой сетки, массив (N, 27, 9)"""
+    n = len(grids)
+    boxes = grids.reshape(n, 3, 3, 3, 3).transpose(0, 1, 3, 2, 4).reshape(n, 9, 9)
+    return np.concatenate([grids, grids.transpose(0, 2, 1), boxes], axis=1)
+
+
+def check_solutions(grids: np.ndarray, chunk_size: int = CHUNK_SIZE) -> np.ndarray:
+    """
+    Векторная check_solution для массива (N, 9, 9): булева маска верных решений.
+
+    В каждой строке, столбце и квадрате побитовое ИЛИ масок 1 << цифра должно
+    дать все 9 бит: девять клеток покрывают девять цифр, только если цифры разные.
+    Сетки обрабатываются кусками по chunk_size, чтобы не держать в памяти все 27
+    единиц для миллиона сеток сразу.
+    >>> grids = np.array([[[(row * 3 + row // 3 + col) % 9 + 1 for col in range(9)] for row in range(9)]] * 2)
+    >>> grids[1, 0, :2] = grids[1, 0, 1::-1]
+    >>> check_solutions(grids)
+    array([ True, False])
+    """
+    grids = np.asarray(grids)
+    if grids.ndim != 3 or grids.shape[1:] != (9, 9):
+        raise ValueError(f"Expected an array of shape (N, 9, 9), got {grids.shape}")
+    result = np.empty(len(grids), dtype=bool)
+    for start in range(0, len(grids), chunk_size):
+        chunk = grids[start : start + chunk_size]
+        in_range = ((chunk >= 1) & (chunk <= 9)).all(axis=(1, 2))
+        bits = np.left_shift(np.uint16(1), np.clip(chunk, 0, 15).astype(np.uint16))
+        masks = np.bitwise_or.reduce(_units(bits), axis=2)
+        result[start : start + chunk_size] = in_range & (masks == ALL_DIGITS).all(axis=1)
+    return result